@@ -16,6 +16,8 @@ from django.core.files import File
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ("id", "name", "user", "created_at")
+    # user is nullable, so Django's automatic select_related() would skip it
+    list_select_related = ("user",)
     search_fields = ("name", "user__username")
     list_filter = ("created_at",)
 
@@ -192,6 +194,7 @@ class ComponentAdmin(admin.ModelAdmin):
 @admin.register(CanvasState)
 class CanvasStateAdmin(admin.ModelAdmin):
     list_display = ("id", "project", "component", "label", "sequence")
+    list_select_related = ("project", "component")
     search_fields = ("label", "project__name", "component__name")
     list_filter = ("project", "component")
 
@@ -208,3 +211,4 @@ class CanvasStateAdmin(admin.ModelAdmin):
 @admin.register(Connection)
 class ConnectionAdmin(admin.ModelAdmin):
     list_display = ("id", "sourceItemId", "targetItemId")
+    list_select_related = ("sourceItemId", "targetItemId")
@@ -0,0 +1,27 @@
+from django.utils.functional import SimpleLazyObject
+
+
+class AbsoluteURIPrefixMiddleware:
+    """
+    Expose ``scheme://host`` as ``request.abs_uri_prefix`` so serializers can
+    build absolute file URLs by string concatenation instead of calling
+    build_absolute_uri per field. The prefix is resolved on first use, so
+    requests that never serialize a file URL don't pay for it.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.abs_uri_prefix = SimpleLazyObject(
+            lambda: f"{request.scheme}://{request.get_host()}"
+        )
+        return self.get_response(request)
+
+
+def absolute_uri_prefix(request):
+    """Cached ``scheme://host`` for `request`, computed here if the middleware did not run."""
+    prefix = getattr(request, "abs_uri_prefix", None)
+    if prefix is None:
+        return request.build_absolute_uri("/")[:-1]
+    return str(prefix)
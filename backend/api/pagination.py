@@ -0,0 +1,32 @@
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+
+
+class ComponentPagination(PageNumberPagination):
+    """
+    Opt-in page-number pagination for the component catalogue.
+
+    Requests without ``page``/``page_size`` keep the unpaginated
+    ``{"components": [...]}`` shape the desktop and web clients load in full;
+    paginated requests are capped at ``max_page_size`` rows.
+    """
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_query_param not in params and self.page_size_query_param not in params:
+            return None
+        # Pages need a stable order to avoid repeating or skipping rows
+        if not queryset.ordered:
+            queryset = queryset.order_by("pk")
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": self.page.paginator.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "components": data,
+        })
@@ -1,8 +1,80 @@
+from django.db import models
 from rest_framework import serializers
+from .middleware import absolute_uri_prefix
 from .models import Component, Project, CanvasState, Connection
+import copy
 import json
 
-class ProjectSerializer(serializers.ModelSerializer):
+
+class CachedFieldsMixin:
+    """
+    Introspect a ModelSerializer's fields once per class and hand every new
+    instance shallow copies, instead of re-running model introspection and
+    deep-copying the declared fields on each request.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = super().get_fields()
+            CachedFieldsMixin._fields_cache[cls] = fields
+        # Copies keep bind() from mutating the cached, unbound originals
+        return {name: copy.copy(field) for name, field in fields.items()}
+
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets for reads: ``?fields=id,name,svg_url`` keeps only the
+    listed fields, so unused columns are neither serialized nor sent.
+    Unknown names are ignored, and a list with no known name at all (e.g. a
+    typo) keeps every field; write requests always see every field.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None or request.method != "GET":
+            return
+        requested = request.query_params.get("fields")
+        if not requested:
+            return
+        allowed = {name.strip() for name in requested.split(",")} & set(self.fields)
+        if not allowed:
+            return
+        for name in set(self.fields) - allowed:
+            self.fields.pop(name)
+
+
+class PrefixedURLMixin:
+    """
+    Build file URLs from the absolute-URI prefix cached on the parent
+    serializer instead of calling request.build_absolute_uri per value.
+    """
+
+    def to_representation(self, value):
+        prefix = getattr(self.parent, "_abs_prefix", None)
+        if prefix is None or not getattr(self, "use_url", True):
+            return super().to_representation(value)
+        if not value:
+            return None
+        try:
+            url = value.url
+        except AttributeError:
+            return None
+        return prefix + url if url.startswith("/") else url
+
+
+class PrefixedFileField(PrefixedURLMixin, serializers.FileField):
+    pass
+
+
+class PrefixedImageField(PrefixedURLMixin, serializers.ImageField):
+    pass
+
+
+class ProjectSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     thumbnail = serializers.ImageField(
         required=False,
         allow_null=True
@@ -28,9 +100,21 @@ class ProjectSerializer(serializers.ModelSerializer):
     # def update(self) removed - logic moved to View
 
 
-class ComponentSerializer(serializers.ModelSerializer):
-    svg_url = serializers.FileField(source='svg', read_only=True)
-    png_url = serializers.FileField(source='png', read_only=True)
+class ComponentSerializer(DynamicFieldsMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    serializer_field_mapping = {
+        **serializers.ModelSerializer.serializer_field_mapping,
+        models.FileField: PrefixedFileField,
+        models.ImageField: PrefixedImageField,
+    }
+
+    svg_url = PrefixedFileField(source='svg', read_only=True)
+    png_url = PrefixedFileField(source='png', read_only=True)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One scheme/host lookup per serializer instead of one per file field per row
+        request = self.context.get("request")
+        self._abs_prefix = absolute_uri_prefix(request) if request else None
 
     class Meta:
         model = Component
@@ -1,7 +1,11 @@
+import json
+
 from django.shortcuts import render
-from django.http import Http404
+from django.http import Http404, HttpResponse
+from django.views.decorators.http import require_safe
 from .models import Component, Project, CanvasState, Connection
 from .serializers import ComponentSerializer, ProjectSerializer,CanvasStateSerializer, ConnectionSerializer
+from .pagination import ComponentPagination
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from rest_framework.decorators import api_view, permission_classes
@@ -9,18 +13,22 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import generics, status
 from rest_framework.response import Response
 from django.contrib.auth.models import User
-from django.contrib.auth.hashers import make_password
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework.permissions import AllowAny
 from rest_framework.parsers import MultiPartParser, FormParser
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, prefetch_related_objects
+
+
+# Constant health-check body, encoded once at import time
+_HELLO_BODY = json.dumps({"message": "Hello from DRF!"}).encode()
 
 
-@api_view(['GET'])
-@permission_classes([AllowAny])
+@require_safe
 def hello_world(request):
-    return Response({"message": "Hello from DRF!"})
+    # Plain Django view: skips DRF auth, throttling, negotiation and rendering
+    return HttpResponse(_HELLO_BODY, content_type="application/json")
 
 class RegisterView(generics.CreateAPIView):
     permission_classes = [AllowAny]
@@ -34,15 +42,18 @@ class RegisterView(generics.CreateAPIView):
             return Response({"error": "Username and password required"},
                             status=status.HTTP_400_BAD_REQUEST)
 
-        if User.objects.filter(username=username).exists():
+        # Rely on the unique username constraint instead of a separate exists() query;
+        # the savepoint keeps an outer transaction usable after a duplicate.
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=username,
+                    email=email,
+                    password=password
+                )
+        except IntegrityError:
             return Response({"error": "Username already exists"},
                             status=status.HTTP_400_BAD_REQUEST)
-
-        user = User.objects.create(
-            username=username,
-            email=email,
-            password=make_password(password)
-        )
         return Response({"message": "User registered successfully", "user": {
             "id": user.id,
             "username": user.username,
@@ -62,20 +73,38 @@ class ComponentListView(generics.ListCreateAPIView):
     serializer_class = ComponentSerializer
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
+    pagination_class = ComponentPagination
 
     ordering_fields = ['s_no', 'name', 'legend']
     ordering = ['s_no']
 
     def get_queryset(self):
-        return (
-            Component.objects
-            .select_related("created_by")
-            .filter(
-                Q(created_by=self.request.user) |
-                Q(created_by__isnull=True)
-            )
+        # created_by is serialized as a bare pk (created_by_id), so no join is needed
+        return Component.objects.filter(
+            Q(created_by=self.request.user) |
+            Q(created_by__isnull=True)
         )
 
+    def get_sparse_columns(self, requested):
+        """
+        Model columns needed to serialize the comma-separated `requested` fields,
+        or None when none of them is a serializer field (all fields are sent then).
+        """
+        serializer_class = self.get_serializer_class()
+        declared = serializer_class._declared_fields
+        known = set(serializer_class.Meta.fields)
+        names = [name.strip() for name in requested.split(",") if name.strip() in known]
+        if not names:
+            return None
+        model_fields = {f.name for f in Component._meta.concrete_fields}
+        columns = set()
+        for name in names:
+            field = declared.get(name)
+            source = (field.source if field is not None and field.source else name).split(".")[0]
+            if source in model_fields:
+                columns.add(source)
+        return columns
+
     def list(self, request, *args, **kwargs):
         # ... (list method remains same) ...
         queryset = self.filter_queryset(self.get_queryset())
@@ -86,6 +115,17 @@ class ComponentListView(generics.ListCreateAPIView):
         svg='',
         png='',
         )
+        requested = request.query_params.get("fields")
+        columns = self.get_sparse_columns(requested) if requested else None
+        if columns is not None:
+            # Skip loading columns (grips, object, ...) the sparse fieldset never reads
+            queryset = queryset.only("id", *columns)
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True, context={'request': request})
+            return self.get_paginated_response(serializer.data)
+
         serializer = self.get_serializer(queryset, many=True, context={'request': request})
         return Response({"components": serializer.data}, status=status.HTTP_200_OK)
 
@@ -192,17 +232,19 @@ class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
     # -----------------------------
     def retrieve(self, request, *args, **kwargs):
         project = self.get_object()
+        # Canvas items in one query, already ordered; only reads need them, so
+        # update() and destroy() don't load rows they are about to replace
+        prefetch_related_objects([project], Prefetch(
+            "canvasstate_set",
+            queryset=CanvasState.objects.select_related("component").order_by("sequence"),
+            to_attr="prefetched_items",
+        ))
 
         # Project detail
         project_data = ProjectSerializer(project).data
 
         # Canvas items (nodes)
-        canvas_items = (
-            CanvasState.objects
-            .filter(project=project)
-            .select_related("component")
-            .order_by("sequence")
-        )
+        canvas_items = project.prefetched_items
 
         items_data = CanvasStateSerializer(canvas_items, many=True).data
 
@@ -215,8 +257,8 @@ class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
 
         # Sequence counter (next available)
         sequence_counter = (
-            canvas_items.last().sequence + 1
-            if canvas_items.exists()
+            canvas_items[-1].sequence + 1
+            if canvas_items
             else 0
         )
         response_data = project_data
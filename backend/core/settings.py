@@ -75,6 +75,8 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Compresses large JSON payloads (component catalogue) and sets Vary: Accept-Encoding
+    "django.middleware.gzip.GZipMiddleware",
 
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -84,6 +86,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "axes.middleware.AxesMiddleware",
+    "api.middleware.AbsoluteURIPrefixMiddleware",
 
 ]
 
@@ -141,6 +144,10 @@ if DEBUG:
             "PASSWORD": os.environ.get("POSTGRES_PASSWORD"),
             "HOST": "127.0.0.1",
             "PORT": "5432",
+            # Keep the connection (and Postgres' per-session catalog and plan
+            # caches) across requests instead of reconnecting for every login
+            "CONN_MAX_AGE": 600,
+            "CONN_HEALTH_CHECKS": True,
         }
     }
 else:
@@ -148,6 +155,7 @@ else:
     DATABASES = {
         "default": dj_database_url.config(
             conn_max_age=600,
+            conn_health_checks=True,
             ssl_require=True
         )
     }
@@ -181,6 +189,10 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.UserRateThrottle',
         'rest_framework.throttling.AnonRateThrottle',
@@ -89,6 +89,11 @@ class RegisterViewTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("error", response.data)
 
+    def test_register_without_email(self):
+        response = self.client.post(self.url, {"username": "carol", "password": "secret"})
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(User.objects.get(username="carol").email, "")
+
     def test_register_missing_password(self):
         data = {"username": "bob"}
         response = self.client.post(self.url, data)
@@ -147,7 +152,15 @@ class HelloWorldTests(APITestCase):
     def test_hello_world_no_auth_required(self):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["message"], "Hello from DRF!")
+        self.assertEqual(response.json()["message"], "Hello from DRF!")
+
+    def test_hello_world_answers_head(self):
+        response = self.client.head(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_hello_world_rejects_post(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
 # ---------------------------------------------------------------------------
@@ -179,6 +192,71 @@ class ComponentListViewTests(APITestCase):
         self.assertIn("DefaultComp", names)
         self.assertNotIn("OtherComp", names)
 
+    def test_list_is_rendered_as_json(self):
+        make_component(self.user, s_no="C001", name="JsonComp")
+        response = self.client.get(self.url)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["components"][0]["name"], "JsonComp")
+
+    def test_list_returns_absolute_file_urls(self):
+        comp = make_component(self.user, s_no="C001", name="UrlComp")
+        response = self.client.get(self.url)
+        data = response.data["components"][0]
+        self.assertEqual(data["svg_url"], "http://testserver" + comp.svg.url)
+        self.assertEqual(data["png"], "http://testserver" + comp.png.url)
+
+    def test_list_is_gzipped_when_accepted(self):
+        for i in range(5):
+            make_component(self.user, s_no=f"C00{i}", name=f"Comp{i}")
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+    def test_list_uses_request_uri_prefix(self):
+        comp = make_component(self.user, s_no="C001", name="PrefixComp")
+        response = self.client.get(self.url, HTTP_HOST="localhost")
+        data = response.data["components"][0]
+        self.assertEqual(data["svg_url"], "http://localhost" + comp.svg.url)
+
+    def test_list_sparse_fields(self):
+        make_component(self.user, s_no="C001", name="SparseComp")
+        response = self.client.get(self.url, {"fields": "id,name,svg_url,bogus"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["components"][0]), {"id", "name", "svg_url"})
+
+    def test_list_sparse_fields_all_unknown_keeps_every_field(self):
+        make_component(self.user, s_no="C001", name="SparseComp")
+        full = self.client.get(self.url).data["components"][0]
+        response = self.client.get(self.url, {"fields": "svgurl"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["components"][0], full)
+
+    def test_list_sparse_fields_defers_unused_columns(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        make_component(self.user, s_no="C001", name="SparseComp")
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, {"fields": "name,svg_url"})
+        self.assertEqual(response.data["components"][0]["name"], "SparseComp")
+        component_sql = [q["sql"] for q in ctx.captured_queries if '"api_component"' in q["sql"]]
+        self.assertEqual(len(component_sql), 1)
+        self.assertNotIn('"grips"', component_sql[0])
+
+    def test_list_paginates_when_page_size_given(self):
+        for i in range(3):
+            make_component(self.user, s_no=f"C00{i}", name=f"Comp{i}")
+        response = self.client.get(self.url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["components"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+        response = self.client.get(self.url, {"page_size": 2, "page": 2})
+        self.assertEqual(len(response.data["components"]), 1)
+        self.assertIsNone(response.data["next"])
+
     def test_list_excludes_components_without_svg_or_png(self):
         # Component without files
         Component.objects.create(s_no="C099", parent="X", name="NoFiles", created_by=self.user)
@@ -348,6 +426,18 @@ class ProjectDetailViewTests(APITestCase):
         response = self.client.get(self.detail_url())
         self.assertEqual(response.data["canvas_state"]["sequence_counter"], 6)
 
+    def test_retrieve_query_count_is_constant(self):
+        item_a = make_canvas_item(self.project, self.comp, sequence=0, x=0, y=0)
+        item_b = make_canvas_item(self.project, self.comp, sequence=1, x=100, y=0)
+        Connection.objects.create(
+            sourceItemId=item_a, targetItemId=item_b,
+            sourceGripIndex=0, targetGripIndex=1, waypoints=[]
+        )
+        # project + prefetched canvas items + connections
+        with self.assertNumQueries(3):
+            response = self.client.get(self.detail_url())
+        self.assertEqual(response.data["canvas_state"]["sequence_counter"], 2)
+
     def test_retrieve_other_user_project_returns_404(self):
         other = make_user("other")
         other_proj = make_project(other, "OtherProj")
@@ -472,6 +562,16 @@ class ProjectDetailViewTests(APITestCase):
         self.client.delete(self.detail_url())
         self.assertEqual(CanvasState.objects.filter(project=self.project).count(), 0)
 
+    def test_destroy_does_not_prefetch_canvas_items(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        make_canvas_item(self.project, self.comp, sequence=0)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.delete(self.detail_url())
+        joined = [q["sql"] for q in ctx.captured_queries if "JOIN" in q["sql"]]
+        self.assertEqual(joined, [])
+
     def test_destroy_other_user_project_returns_404(self):
         other = make_user("other2")
         other_proj = make_project(other, "OtherProj")
@@ -521,4 +621,70 @@ class TokenRefreshViewTests(APITestCase):
             "DEFAULT_THROTTLE_CLASSES": [],
         }):
             response = self.client.post(self.refresh_url, {"refresh": "bad.token.here"})
-            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+            self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+# ---------------------------------------------------------------------------
+# Serializers – Field cache
+# ---------------------------------------------------------------------------
+
+class SerializerFieldCacheTests(TestCase):
+    def test_instances_get_independent_bound_fields(self):
+        from api.serializers import ComponentSerializer
+
+        first = ComponentSerializer()
+        second = ComponentSerializer()
+        self.assertEqual(list(first.fields), list(second.fields))
+        self.assertIsNot(first.fields["name"], second.fields["name"])
+        self.assertIs(first.fields["name"].parent, first)
+        self.assertIs(second.fields["name"].parent, second)
+
+
+# ---------------------------------------------------------------------------
+# Renderers – orjson
+# ---------------------------------------------------------------------------
+
+class ORJSONRendererTests(TestCase):
+    def test_render_matches_drf_json_output(self):
+        from decimal import Decimal
+        from rest_framework.renderers import JSONRenderer
+        from api.renderers import ORJSONRenderer
+
+        data = {"name": "Pump – Ω", "grips": [{"x": 1.5}], "price": Decimal("2.50"), "none": None}
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(data)),
+            json.loads(JSONRenderer().render(data)),
+        )
+
+    def test_render_datetimes_and_line_separators_like_drf(self):
+        import datetime
+        from django.utils import timezone
+        from rest_framework.renderers import JSONRenderer
+        from api.renderers import ORJSONRenderer
+
+        data = {
+            "at": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            "day": datetime.date(2024, 5, 1),
+            "note": "line\u2028para\u2029",
+        }
+        rendered = ORJSONRenderer().render(data)
+        self.assertEqual(rendered, JSONRenderer().render(data))
+        self.assertIn(b'"2024-05-01T12:30:15.123456Z"', rendered)
+
+    def test_render_none_is_empty(self):
+        from api.renderers import ORJSONRenderer
+
+        self.assertEqual(ORJSONRenderer().render(None), b"")
+
+
+class AbsoluteURIPrefixMiddlewareTests(TestCase):
+    def test_prefix_is_resolved_only_when_used(self):
+        from django.test import RequestFactory
+        from api.middleware import AbsoluteURIPrefixMiddleware, absolute_uri_prefix
+
+        request = RequestFactory().get("/api/hello/", HTTP_HOST="localhost")
+        with patch.object(request, "get_host", wraps=request.get_host) as get_host:
+            AbsoluteURIPrefixMiddleware(lambda r: None)(request)
+            get_host.assert_not_called()
+            self.assertEqual(absolute_uri_prefix(request), "http://localhost")
+            self.assertEqual(absolute_uri_prefix(request), "http://localhost")
+            get_host.assert_called_once()
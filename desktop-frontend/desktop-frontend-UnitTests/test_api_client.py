@@ -24,7 +24,7 @@ class ApiClientTests(unittest.TestCase):
         self.addCleanup(self.base_url_patch.stop)
         self.addCleanup(self.token_patch.stop)
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_login_success_returns_tokens(self, mock_post):
         mock_response = Mock(status_code=200)
         mock_response.json.return_value = {"access": "access-token", "refresh": "refresh-token"}
@@ -36,7 +36,7 @@ class ApiClientTests(unittest.TestCase):
         self.assertEqual(refresh, "refresh-token")
         mock_post.assert_called_once()
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_login_failure_raises_api_error(self, mock_post):
         mock_response = Mock(status_code=401)
         mock_response.json.return_value = {"detail": "Invalid credentials."}
@@ -47,14 +47,14 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertIn("Invalid credentials", str(ctx.exception))
 
-    @patch("src.api_client.requests.post", side_effect=requests.RequestException("offline"))
+    @patch("src.api_client._session.post", side_effect=requests.RequestException("offline"))
     def test_login_network_error_raises_api_error(self, mock_post):
         with self.assertRaises(ApiError) as ctx:
             login("alice", "secret")
 
         self.assertIn("Could not reach server", str(ctx.exception))
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_register_success_returns_response_json(self, mock_post):
         mock_response = Mock(status_code=201)
         mock_response.json.return_value = {"message": "User registered successfully"}
@@ -64,7 +64,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertEqual(result["message"], "User registered successfully")
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_register_failure_raises_api_error(self, mock_post):
         mock_response = Mock(status_code=400)
         mock_response.json.return_value = {"message": "Username already exists"}
@@ -75,7 +75,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertIn("Username already exists", str(ctx.exception))
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_register_edge_when_response_body_is_not_json(self, mock_post):
         mock_response = Mock(status_code=500)
         mock_response.json.side_effect = ValueError("bad json")
@@ -86,7 +86,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertIn("Registration failed", str(ctx.exception))
 
-    @patch("src.api_client.requests.get")
+    @patch("src.api_client._session.get")
     def test_get_components_returns_component_list(self, mock_get):
         mock_response = Mock(status_code=200)
         mock_response.json.return_value = {"components": [{"name": "Pump"}]}
@@ -97,7 +97,7 @@ class ApiClientTests(unittest.TestCase):
         self.assertEqual(components, [{"name": "Pump"}])
         mock_get.assert_called_once()
 
-    @patch("src.api_client.requests.get")
+    @patch("src.api_client._session.get")
     def test_get_components_returns_empty_list_on_unexpected_payload(self, mock_get):
         mock_response = Mock(status_code=200)
         mock_response.json.return_value = {"unexpected": True}
@@ -105,7 +105,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertEqual(get_components(), [])
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_create_project_success_returns_project(self, mock_post):
         mock_response = Mock(status_code=201)
         mock_response.json.return_value = {"project": {"id": 7, "name": "Demo"}}
@@ -115,7 +115,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertEqual(project, {"id": 7, "name": "Demo"})
 
-    @patch("src.api_client.requests.post")
+    @patch("src.api_client._session.post")
     def test_create_project_failure_returns_none(self, mock_post):
         mock_response = Mock(status_code=400)
         mock_response.text = "bad request"
@@ -123,7 +123,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertIsNone(create_project("", "desc"))
 
-    @patch("src.api_client.requests.put")
+    @patch("src.api_client._session.put")
     def test_update_project_success_returns_json(self, mock_put):
         mock_response = Mock(status_code=200)
         mock_response.json.return_value = {"status": "success"}
@@ -133,7 +133,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertEqual(result, {"status": "success"})
 
-    @patch("src.api_client.requests.put")
+    @patch("src.api_client._session.put")
     def test_update_project_failure_returns_none(self, mock_put):
         mock_response = Mock(status_code=500)
         mock_response.text = "server error"
@@ -141,7 +141,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertIsNone(update_project(5, name="Updated") )
 
-    @patch("src.api_client.requests.delete")
+    @patch("src.api_client._session.delete")
     def test_delete_project_success_returns_json(self, mock_delete):
         mock_response = Mock(status_code=200)
         mock_response.json.return_value = {"status": "success"}
@@ -149,7 +149,7 @@ class ApiClientTests(unittest.TestCase):
 
         self.assertEqual(delete_project(5), {"status": "success"})
 
-    @patch("src.api_client.requests.delete")
+    @patch("src.api_client._session.delete")
     def test_delete_project_failure_returns_none(self, mock_delete):
         mock_response = Mock(status_code=404)
         mock_delete.return_value = mock_response
@@ -1,3 +1,4 @@
+import os
 import unittest
 from tempfile import TemporaryDirectory
 from pathlib import Path
@@ -71,6 +72,21 @@ class CanvasResourcesTests(unittest.TestCase):
             self.assertEqual(find_svg_file("Fallback.svg", "Unknown", str(base_dir)), str(fallback_file))
             self.assertIsNone(find_svg_file("Missing.svg", "Pumps", str(base_dir)))
 
+    def test_find_svg_lookups_see_files_added_after_first_search(self):
+        with TemporaryDirectory() as tmpdir:
+            base_dir = Path(tmpdir)
+            svg_dir = base_dir / "ui" / "assets" / "svg" / "Pumps"
+            svg_dir.mkdir(parents=True)
+            (svg_dir / "Pump_A.svg").write_text("<svg></svg>", encoding="utf-8")
+            self.assertIsNone(find_svg_path("Pump B", str(base_dir)))
+
+            added = svg_dir / "Pump_B.svg"
+            added.write_text("<svg></svg>", encoding="utf-8")
+            os.utime(svg_dir, ns=(0, os.stat(svg_dir).st_mtime_ns + 1))
+
+            self.assertEqual(find_svg_path("Pump B", str(base_dir)), str(added))
+            self.assertEqual(find_svg_file("Pump_B.svg", "Unknown", str(base_dir)), str(added))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -92,3 +92,34 @@ def test_load_label_data_falls_back_to_csv_when_json_missing(tmp_path):
 
     assert result["inflowline"] == {"legend": "IN", "suffix": "", "count": 0}
     assert result["heatexchanger"] == {"legend": "HEX", "suffix": "B", "count": 0}
+
+
+def test_load_label_data_reads_csv_columns_by_header_name(tmp_path):
+    assets_dir = tmp_path / "ui" / "assets"
+    assets_dir.mkdir(parents=True)
+
+    with open(assets_dir / "Component_Details.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["s_no", "suffix", "name", "parent", "legend", "object"])
+        writer.writerow(["1", " C ", "Pump", "Pumps", " P ", ""])
+        writer.writerow(["2", "", "Valve"])
+
+    result = load_label_data(str(tmp_path))
+
+    assert result["pump"] == {"legend": "P", "suffix": "C", "count": 0}
+    assert result["valve"] == {"legend": "", "suffix": "", "count": 0}
+
+
+def test_load_label_data_parses_once_but_returns_independent_counters(tmp_path):
+    assets_dir = tmp_path / "ui" / "assets"
+    assets_dir.mkdir(parents=True)
+    json_path = assets_dir / "components_cache.json"
+    json_path.write_text(json.dumps([{"object": "PumpUnit", "legend": "P", "suffix": "A"}]), encoding="utf-8")
+
+    first = load_label_data(str(tmp_path))
+    first["pumpunit"]["count"] += 1
+    json_path.unlink()
+    second = load_label_data(str(tmp_path))
+
+    assert second["pumpunit"] == {"legend": "P", "suffix": "A", "count": 0}
+    assert second is not first
@@ -166,3 +166,50 @@ def test_auto_router_find_path_returns_orthogonal_points():
         is_horizontal = abs(p1.y() - p2.y()) < 0.01
         is_vertical = abs(p1.x() - p2.x()) < 0.01
         assert is_horizontal or is_vertical
+
+
+def test_cell_grid_merge_clips_to_overlap():
+    cached = auto_router.CellGrid.from_spans([(-5, 2, -5, 2), (8, 9, 8, 9)])
+    grid = auto_router.CellGrid(0, 0, 5, 5)
+    grid.merge(cached)
+
+    assert grid.cells[:3, :3].all()
+    assert grid.cells.sum() == 9
+
+
+def test_find_path_memoizes_routes_in_routing_cache():
+    cache = auto_router.build_routing_cache([QRectF(120, 80, 60, 80)], [])
+    kwargs = dict(
+        start=QPointF(40, 40),
+        end=QPointF(260, 240),
+        start_side="right",
+        end_side="left",
+        component_rects=[],
+        exclude_rects=[],
+        connection_segments=[],
+        canvas_bounds=QRectF(0, 0, 600, 400),
+        routing_cache=cache,
+    )
+
+    first = auto_router.find_path(**kwargs)
+    second = auto_router.find_path(**kwargs)
+
+    assert len(cache["paths"]) == 1
+    assert [(p.x(), p.y()) for p in first] == [(p.x(), p.y()) for p in second]
+    first[0].setX(-1)
+    assert second[0].x() != -1
+
+
+def test_clear_l_path_prefers_leg_along_start_side():
+    cspace = auto_router.np.zeros((10, 10), dtype=auto_router.np.uint8)
+    roi = (0, 9, 0, 9)
+
+    assert auto_router._clear_l_path(cspace, roi, (1, 1), (6, 5), True) == [(1, 1), (6, 1), (6, 5)]
+    assert auto_router._clear_l_path(cspace, roi, (1, 1), (6, 5), False) == [(1, 1), (1, 5), (6, 5)]
+
+    # Blocking the corner forces the search; the goal cell itself may sit inside an obstacle
+    cspace[1, 6] = auto_router.CELL_OBSTACLE
+    cspace[5, 6] = auto_router.CELL_OBSTACLE
+    assert auto_router._clear_l_path(cspace, roi, (1, 1), (6, 5), True) is None
+    assert auto_router._clear_l_path(cspace, roi, (1, 1), (6, 5), False) == [(1, 1), (1, 5), (6, 5)]
+    assert cspace[5, 6] == auto_router.CELL_OBSTACLE
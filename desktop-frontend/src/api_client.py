@@ -3,6 +3,10 @@ import src.app_state as app_state
 
 DEFAULT_TIMEOUT = 5  # seconds
 
+# One keep-alive session for every backend call, so login, sync and project
+# saves reuse pooled connections instead of a new TCP/TLS handshake each time
+_session = requests.Session()
+
 
 class ApiError(Exception):
     pass
@@ -15,7 +19,7 @@ def login(username: str, password: str):
     url = f"{app_state.BACKEND_BASE_URL}/api/auth/login/"
 
     try:
-        resp = requests.post(
+        resp = _session.post(
             url,
             json={
                 "username": username,
@@ -50,7 +54,7 @@ def register(username: str, email: str, password: str):
     url = f"{app_state.BACKEND_BASE_URL}/api/auth/register/"
 
     try:
-        resp = requests.post(
+        resp = _session.post(
             url,
             json={
                 "username": username,
@@ -88,7 +92,7 @@ def get_components():
         if app_state.access_token:
             headers["Authorization"] = f"Bearer {app_state.access_token}"
         
-        resp = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        resp = _session.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
         if resp.status_code == 200:
             data = resp.json()
 
@@ -117,7 +121,7 @@ def post_component(data, files):
         headers["Authorization"] = f"Bearer {app_state.access_token}"
 
     try:
-        response = requests.post(url, headers=headers, data=data, files=files)
+        response = _session.post(url, headers=headers, data=data, files=files)
         return response
     except Exception as e:
         print("[API ERROR] POST failed:", e)
@@ -136,7 +140,7 @@ def get_projects():
         headers["Authorization"] = f"Bearer {app_state.access_token}"
     
     try:
-        resp = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        resp = _session.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
         
         if resp.status_code == 200:
             data = resp.json()
@@ -165,7 +169,7 @@ def get_project(project_id):
         headers["Authorization"] = f"Bearer {app_state.access_token}"
     
     try:
-        resp = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        resp = _session.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
         
         if resp.status_code == 200:
             return resp.json()
@@ -199,7 +203,7 @@ def create_project(name, description="", canvas_state=None):
         payload["canvas_state"] = canvas_state
     
     try:
-        resp = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
+        resp = _session.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
         
         if resp.status_code in (200, 201):
             data = resp.json()
@@ -236,7 +240,7 @@ def update_project(project_id, name=None, description=None, canvas_state=None):
         payload["canvas_state"] = canvas_state
     
     try:
-        resp = requests.put(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
+        resp = _session.put(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
         
         if resp.status_code == 200:
             return resp.json()
@@ -262,7 +266,7 @@ def delete_project(project_id):
         headers["Authorization"] = f"Bearer {app_state.access_token}"
     
     try:
-        resp = requests.delete(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+        resp = _session.delete(url, headers=headers, timeout=DEFAULT_TIMEOUT)
         
         if resp.status_code == 200:
             return resp.json()
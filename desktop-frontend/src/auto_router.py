@@ -4,7 +4,7 @@ Implements orthogonal routing with obstacle avoidance using BFS pathfinding.
 
 Features:
 - Grid-based logical coordinate system
-- Obstacle detection for component bounding rectangles
+- Obstacle detection for component bounding rectangles (rasterized bitmaps)
 - Start/end component exclusion from obstacles
 - BFS parent-map (O(n) memory, not O(n^2))
 - Canvas bounds enforcement (no infinite grid search)
@@ -12,8 +12,9 @@ Features:
 - Safe L-shaped fallback if path not found
 """
 
-from collections import deque
-from typing import List, Tuple, Set, Dict, Optional
+from typing import List, Tuple, Dict, Optional
+
+import numpy as np
 from PyQt5.QtCore import QPointF, QRectF
 
 
@@ -23,6 +24,17 @@ GRID_RES = 10
 # Padding around component rects to avoid running right along edges
 COMP_PAD = 14
 
+# A* move costs on top of the 1.0 per-cell step
+TURN_PENALTY = 60.0        # Penalty for changing direction
+CROSSOVER_PENALTY = 25.0   # Penalty for crossing another line
+OBSTACLE_PENALTY = 50000.0 # Soft obstacle penalty
+
+# Bit flags of the fused configuration-space grid searched by A*
+CELL_OBSTACLE = 1
+CELL_LINE = 2
+
+INF = float('inf')
+
 
 def _to_grid(pt: QPointF) -> Tuple[int, int]:
     """Convert a logical QPointF to a grid (col, row) integer tuple."""
@@ -37,53 +49,255 @@ def _to_world(col: int, row: int) -> QPointF:
     return QPointF(col * GRID_RES, row * GRID_RES)
 
 
-def _rect_to_grid_cells(rect: QRectF) -> Set[Tuple[int, int]]:
+def _rect_cell_span(rect: QRectF) -> Tuple[int, int, int, int]:
     """
-    Return the set of grid cells that fall inside a QRectF (padded).
-    Used to build the obstacle set for component bounding boxes.
+    Return the inclusive (col_min, col_max, row_min, row_max) cell span covered
+    by a QRectF (padded). Used to rasterize component bounding boxes.
     """
-    cells = set()
-    # Apply padding
     padded = rect.adjusted(-COMP_PAD, -COMP_PAD, COMP_PAD, COMP_PAD)
-    col_min = int(padded.left() / GRID_RES)
-    col_max = int(padded.right()  / GRID_RES)
-    row_min = int(padded.top()   / GRID_RES)
-    row_max = int(padded.bottom() / GRID_RES)
-    for c in range(col_min, col_max + 1):
-        for r in range(row_min, row_max + 1):
-            cells.add((c, r))
-    return cells
+    return (
+        int(padded.left()   / GRID_RES),
+        int(padded.right()  / GRID_RES),
+        int(padded.top()    / GRID_RES),
+        int(padded.bottom() / GRID_RES),
+    )
 
 
-def _seg_to_grid_cells(p1: QPointF, p2: QPointF) -> Set[Tuple[int, int]]:
+def _seg_cell_spans(p1: QPointF, p2: QPointF) -> List[Tuple[int, int, int, int]]:
     """
-    Return the set of grid cells covered by an orthogonal segment p1→p2.
+    Return the cell spans covered by an orthogonal segment p1→p2.
     Only works correctly for purely horizontal or purely vertical segments.
     """
-    cells = set()
     c1, r1 = _to_grid(p1)
     c2, r2 = _to_grid(p2)
 
-    if r1 == r2:  # horizontal
-        for c in range(min(c1, c2), max(c1, c2) + 1):
-            cells.add((c, r1))
-    elif c1 == c2:  # vertical
-        for r in range(min(r1, r2), max(r1, r2) + 1):
-            cells.add((c1, r))
-    else:
-        # Diagonal segment (shouldn't happen for orthogonal paths, but handle safely)
-        cells.add((c1, r1))
-        cells.add((c2, r2))
-    return cells
+    if r1 == r2 or c1 == c2:  # horizontal / vertical
+        return [(min(c1, c2), max(c1, c2), min(r1, r2), max(r1, r2))]
+    # Diagonal segment (shouldn't happen for orthogonal paths, but handle safely)
+    return [(c1, c1, r1, r1), (c2, c2, r2, r2)]
+
+
+class CellGrid:
+    """
+    Boolean bitmap of grid cells anchored at an arbitrary (col0, row0) origin.
+
+    Rectangles are rasterized once with a single slice assignment, so the
+    pathfinder can test a cell with one array read instead of hashing tuples
+    into a set of obstacle cells.
+    """
+
+    def __init__(self, col0: int, row0: int, cols: int, rows: int):
+        self.col0 = col0
+        self.row0 = row0
+        self.cells = np.zeros((max(rows, 0), max(cols, 0)), dtype=np.bool_)
+
+    @classmethod
+    def from_spans(cls, spans: List[Tuple[int, int, int, int]]) -> "CellGrid":
+        """Build a grid just large enough to hold every span."""
+        if not spans:
+            return cls(0, 0, 0, 0)
+        col0 = min(s[0] for s in spans)
+        row0 = min(s[2] for s in spans)
+        cols = max(s[1] for s in spans) - col0 + 1
+        rows = max(s[3] for s in spans) - row0 + 1
+        grid = cls(col0, row0, cols, rows)
+        grid.fill_spans(spans)
+        return grid
+
+    def fill_spans(self, spans: List[Tuple[int, int, int, int]]):
+        rows, cols = self.cells.shape
+        for c_min, c_max, r_min, r_max in spans:
+            # Clip to the grid; negative slice starts would otherwise wrap around
+            c_lo = max(c_min - self.col0, 0)
+            c_hi = min(c_max - self.col0 + 1, cols)
+            r_lo = max(r_min - self.row0, 0)
+            r_hi = min(r_max - self.row0 + 1, rows)
+            if c_lo < c_hi and r_lo < r_hi:
+                self.cells[r_lo:r_hi, c_lo:c_hi] = True
+
+    def merge(self, other: "CellGrid"):
+        """OR the overlapping region of `other` into this grid."""
+        rows, cols = self.cells.shape
+        o_rows, o_cols = other.cells.shape
+        c_lo = max(self.col0, other.col0)
+        c_hi = min(self.col0 + cols, other.col0 + o_cols)
+        r_lo = max(self.row0, other.row0)
+        r_hi = min(self.row0 + rows, other.row0 + o_rows)
+        if c_lo >= c_hi or r_lo >= r_hi:
+            return
+        self.cells[r_lo - self.row0:r_hi - self.row0, c_lo - self.col0:c_hi - self.col0] |= \
+            other.cells[r_lo - other.row0:r_hi - other.row0, c_lo - other.col0:c_hi - other.col0]
+
 
 def build_routing_cache(component_rects: List[QRectF], connection_segments: List[Tuple[QPointF, QPointF]]) -> Dict:
-    obstacles: Set[Tuple[int, int]] = set()
-    for rect in component_rects:
-        obstacles |= _rect_to_grid_cells(rect)
-    line_cells: Set[Tuple[int, int]] = set()
+    obstacle_spans = [_rect_cell_span(rect) for rect in component_rects]
+    line_spans: List[Tuple[int, int, int, int]] = []
     for p1, p2 in connection_segments:
-        line_cells |= _seg_to_grid_cells(p1, p2)
-    return {'obstacles': obstacles, 'line_cells': line_cells}
+        line_spans.extend(_seg_cell_spans(p1, p2))
+    return {
+        'obstacles': CellGrid.from_spans(obstacle_spans),
+        'line_cells': CellGrid.from_spans(line_spans),
+    }
+
+def _astar_search(
+    cspace: bytes,
+    grid_h: int,
+    roi: Tuple[int, int, int, int],
+    sg: Tuple[int, int],
+    eg: Tuple[int, int],
+) -> List[Tuple[int, int]]:
+    """
+    A* kernel over a flat column-major configuration-space grid in grid-local
+    coordinates; each byte holds the CELL_OBSTACLE / CELL_LINE flags of a cell.
+
+    A search state is the single int ``cell * 4 + dir_idx`` with
+    ``cell = col * grid_h + row``, so heap entries are plain ints and cost and
+    parent lookups index preallocated flat lists instead of hashing into dicts.
+    Those lists are sized by `cspace`, so callers frame it to the search region
+    (see _compute_path) rather than the whole canvas.
+    Returns the cell-by-cell path from `sg` to `eg`, or [] if unreachable.
+    """
+    import heapq
+
+    roi_col_lo, roi_col_hi, roi_row_lo, roi_row_hi = roi
+    eg_c, eg_r = eg
+    goal_cell = eg_c * grid_h + eg_r
+
+    def heuristic(c: int, r: int, dir_idx: int) -> float:
+        """
+        Manhattan distance plus one TURN_PENALTY whenever the goal cannot be
+        reached by continuing straight. Every non-straight route pays at least
+        one turn, so the bound stays admissible while pruning far more cells
+        than plain Manhattan distance (a turn costs as much as 60 steps).
+        """
+        dx = eg_c - c
+        dy = eg_r - r
+        h = abs(dx) + abs(dy)
+        if dx and dy:
+            return h + TURN_PENALTY
+        if dx:
+            return h + (TURN_PENALTY if dir_idx != (0 if dx > 0 else 1) else 0.0)
+        if dy:
+            return h + (TURN_PENALTY if dir_idx != (2 if dy > 0 else 3) else 0.0)
+        return h
+
+    # (f_score, cost, state)
+    pq = []
+    n_states = len(cspace) * 4
+    parent: List[int] = [-1] * n_states
+    best_cost: List[float] = [INF] * n_states
+
+    # Initialize start state for all 4 possible starting directions
+    start_cell = sg[0] * grid_h + sg[1]
+    for i in range(4):
+        state = start_cell * 4 + i
+        best_cost[state] = 0.0
+        heapq.heappush(pq, (heuristic(sg[0], sg[1], i), 0.0, state))
+
+    # Neighbour table (dc, dr, cell delta, dir_idx)
+    dirs = ((1, 0, grid_h, 0), (-1, 0, -grid_h, 1), (0, 1, 1, 2), (0, -1, -1, 3))
+
+    found_state = -1
+    while pq:
+        f, cost, state = heapq.heappop(pq)
+        cell = state >> 2
+        dir_idx = state & 3
+
+        if cell == goal_cell:
+            found_state = state
+            break
+
+        # Fast state check
+        if best_cost[state] < cost:
+            continue
+
+        cc, cr = divmod(cell, grid_h)
+        for dc, dr, d_cell, n_dir_idx in dirs:
+            nc, nr = cc + dc, cr + dr
+
+            # Inline bounds check completely removing nested unrolls
+            if nc < roi_col_lo or nc > roi_col_hi or nr < roi_row_lo or nr > roi_row_hi:
+                continue
+
+            # Move Cost
+            move_cost = 1.0
+            if dir_idx != n_dir_idx:
+                move_cost += TURN_PENALTY
+
+            n_cell = cell + d_cell
+            flags = cspace[n_cell]
+            if flags:
+                if flags & CELL_LINE:
+                    move_cost += CROSSOVER_PENALTY
+                if flags & CELL_OBSTACLE and n_cell != goal_cell:
+                    move_cost += OBSTACLE_PENALTY
+
+            new_cost = cost + move_cost
+            n_state = n_cell * 4 + n_dir_idx
+
+            if new_cost >= best_cost[n_state]:
+                continue
+
+            best_cost[n_state] = new_cost
+            parent[n_state] = state
+            heapq.heappush(pq, (new_cost + heuristic(nc, nr, n_dir_idx), new_cost, n_state))
+
+    if found_state == -1:
+        return []
+
+    path: List[Tuple[int, int]] = []
+    state = found_state
+    while state != -1:
+        path.append(divmod(state >> 2, grid_h))
+        state = parent[state]
+    path.reverse()
+    return path
+
+
+def _clear_l_path(
+    cspace_grid: np.ndarray,
+    roi: Tuple[int, int, int, int],
+    sg: Tuple[int, int],
+    eg: Tuple[int, int],
+    horizontal_first: bool,
+) -> Optional[List[Tuple[int, int]]]:
+    """
+    Corner cells of the single-turn L route from `sg` to `eg` (grid-local),
+    or None if it leaves the ROI or enters a cell A* would penalise.
+
+    Mirrors the A* cost rules: the start cell is never charged and the goal
+    cell is exempt from the obstacle penalty but not the crossover one.
+    """
+    roi_col_lo, roi_col_hi, roi_row_lo, roi_row_hi = roi
+    (sc, sr), (ec, er) = sg, eg
+    if sg == eg or not (roi_col_lo <= min(sc, ec) and max(sc, ec) <= roi_col_hi
+                        and roi_row_lo <= min(sr, er) and max(sr, er) <= roi_row_hi):
+        return None
+
+    if horizontal_first:
+        corner = (ec, sr)
+        legs = (cspace_grid[sr, min(sc, ec):max(sc, ec) + 1],
+                cspace_grid[min(sr, er):max(sr, er) + 1, ec])
+    else:
+        corner = (sc, er)
+        legs = (cspace_grid[min(sr, er):max(sr, er) + 1, sc],
+                cspace_grid[er, min(sc, ec):max(sc, ec) + 1])
+
+    # Mask the start and goal cells for the vectorized test, then restore them
+    start_flags = cspace_grid[sr, sc]
+    goal_flags = cspace_grid[er, ec]
+    cspace_grid[sr, sc] = 0
+    cspace_grid[er, ec] = goal_flags & CELL_LINE
+    blocked = legs[0].any() or legs[1].any()
+    cspace_grid[sr, sc] = start_flags
+    cspace_grid[er, ec] = goal_flags
+    if blocked:
+        return None
+
+    if corner in (sg, eg):  # straight run, no turn
+        return [sg, eg]
+    return [sg, corner, eg]
+
 
 def find_path(
     start: QPointF,
@@ -107,48 +321,51 @@ def find_path(
     exclude_rects      : rects to SKIP when building obstacles (start/end components)
     connection_segments: existing connection segments added as thin-cell obstacles
     canvas_bounds      : logical canvas size — BFS never leaves this area
-    routing_cache      : Optional pre-computed obstacles and line cells for performance
+    routing_cache      : Optional pre-computed obstacles and line cells for performance.
+                         Finished routes are memoized in its 'paths' dict, keyed by
+                         every other argument, for as long as the cache lives.
 
     Returns
     -------
     List of QPointF forming an orthogonal path. Guaranteed to have ≥ 2 points.
     Falls back to a minimal L-shaped path if BFS finds nothing.
     """
+    if routing_cache is None:
+        return _compute_path(start, end, start_side, end_side, component_rects,
+                             connection_segments, canvas_bounds, None)
+
+    # The cached obstacles are fixed for the cache's lifetime, so the
+    # remaining inputs fully determine the route.
+    key = (
+        start.x(), start.y(), end.x(), end.y(), start_side, end_side,
+        canvas_bounds.getRect(),
+        tuple(rect.getRect() for rect in component_rects),
+        tuple((p1.x(), p1.y(), p2.x(), p2.y()) for p1, p2 in connection_segments),
+    )
+    path_cache = routing_cache.setdefault('paths', {})
+    path = path_cache.get(key)
+    if path is None:
+        path = _compute_path(start, end, start_side, end_side, component_rects,
+                             connection_segments, canvas_bounds, routing_cache)
+        path_cache[key] = path
+    # Hand out copies: callers keep and mutate the returned points
+    return [QPointF(pt) for pt in path]
+
+
+def _compute_path(
+    start: QPointF,
+    end: QPointF,
+    start_side: str,
+    end_side: str,
+    component_rects: List[QRectF],
+    connection_segments: List[Tuple[QPointF, QPointF]],
+    canvas_bounds: QRectF,
+    routing_cache: Optional[Dict],
+) -> List[QPointF]:
+    """Uncached body of find_path."""
 
     # ------------------------------------------------------------------ #
-    # 1. Build obstacle set and line cost set                            #
-    # ------------------------------------------------------------------ #
-    if routing_cache:
-        base_obstacles = routing_cache.get('obstacles', set())
-        base_line_cells = routing_cache.get('line_cells', set())
-    else:
-        base_obstacles = set()
-        base_line_cells = set()
-
-    dyn_obstacles: Set[Tuple[int, int]] = set()
-    for rect in component_rects:
-        # We explicitly include start/end components. Because they are Soft Obstacles (50,000 cost), 
-        # the pathfinder will immediately take the shortest route out to escape the penalty,
-        # which mathematically prevents lines from running a full length straight through them.
-        dyn_obstacles |= _rect_to_grid_cells(rect)
-
-    dyn_line_cells: Set[Tuple[int, int]] = set()
-    for p1, p2 in connection_segments:
-        dyn_line_cells |= _seg_to_grid_cells(p1, p2)
-
-    # ------------------------------------------------------------------ #
-    # 2. Compute canvas grid bounds                                        #
-    # ------------------------------------------------------------------ #
-    col_lo = int(canvas_bounds.left()   / GRID_RES) - 1
-    col_hi = int(canvas_bounds.right()  / GRID_RES) + 1
-    row_lo = int(canvas_bounds.top()    / GRID_RES) - 1
-    row_hi = int(canvas_bounds.bottom() / GRID_RES) + 1
-
-    def in_bounds(c: int, r: int) -> bool:
-        return col_lo <= c <= col_hi and row_lo <= r <= row_hi
-
-    # ------------------------------------------------------------------ #
-    # 3. Convert start/end to grid                                       #
+    # 1. Convert start/end to grid                                       #
     # ------------------------------------------------------------------ #
     def _to_grid_directional(pt: QPointF, side: str) -> Tuple[int, int]:
         import math
@@ -164,12 +381,12 @@ def find_path(
     eg = _to_grid_directional(end, end_side)
 
     # ------------------------------------------------------------------ #
-    # 4. A* Algorithm (Heuristic Search)                                 #
+    # 2. Compute canvas grid bounds and the search region                  #
     # ------------------------------------------------------------------ #
-    import heapq
-
-    TURN_PENALTY = 60.0      # Penalty for changing direction
-    CROSSOVER_PENALTY = 25.0  # Penalty for crossing another line
+    col_lo = int(canvas_bounds.left()   / GRID_RES) - 1
+    col_hi = int(canvas_bounds.right()  / GRID_RES) + 1
+    row_lo = int(canvas_bounds.top()    / GRID_RES) - 1
+    row_hi = int(canvas_bounds.bottom() / GRID_RES) + 1
 
     # Search Area Limiting: Define a "Region of Interest" (ROI)
     # This prevents searching the entire 3000x2000 canvas for a small connection.
@@ -178,95 +395,78 @@ def find_path(
     roi_col_hi = min(col_hi, max(sg[0], eg[0]) + margin)
     roi_row_lo = max(row_lo, min(sg[1], eg[1]) - margin)
     roi_row_hi = min(row_hi, max(sg[1], eg[1]) + margin)
-    
-    # Pre-merge caches for O(1) inner loop lookups
-    obstacles = base_obstacles | dyn_obstacles if dyn_obstacles else base_obstacles
-    line_cells = base_line_cells | dyn_line_cells if dyn_line_cells else base_line_cells
 
-    # (f_score, cost, c, r, dir_idx)
-    pq = []
-    
-    eg_c, eg_r = eg[0], eg[1]
-    
-    # Initialize start state for all 4 possible starting directions
-    for i in range(4):
-        h = abs(sg[0] - eg_c) + abs(sg[1] - eg_r)
-        heapq.heappush(pq, (h, 0, sg[0], sg[1], i))
-    
-    parent: Dict[Tuple[int, int, int], Optional[Tuple[int, int, int]]] = {}
-    best_cost: Dict[Tuple[int, int, int], float] = {}
-    for i in range(4):
-        parent[(sg[0], sg[1], i)] = None
-        best_cost[(sg[0], sg[1], i)] = 0.0
-
-    found_state = None
-    
-    # Pre-pack direction iterator (dc, dr, dir_idx)
-    dirs = ((1, 0, 0), (-1, 0, 1), (0, 1, 2), (0, -1, 3))
-    
-    while pq:
-        f, cost, cc, cr, dir_idx = heapq.heappop(pq)
-        
-        if cc == eg_c and cr == eg_r:
-            found_state = (cc, cr, dir_idx)
-            break
-            
-        # Fast state check
-        if best_cost.get((cc, cr, dir_idx), float('inf')) < cost:
-            continue
+    # Nothing outside the ROI is ever read, so the bitmaps only cover it (plus
+    # start/end, so every search state maps to a valid flat index). Routing
+    # cost then follows the connection's extent, not the canvas size.
+    frame_col = min(roi_col_lo, sg[0], eg[0])
+    frame_row = min(roi_row_lo, sg[1], eg[1])
+    grid_w = max(roi_col_hi, sg[0], eg[0]) - frame_col + 1
+    grid_h = max(roi_row_hi, sg[1], eg[1]) - frame_row + 1
 
-        for dc, dr, n_dir_idx in dirs:
-            nc, nr = cc + dc, cr + dr
-            
-            # Inline bounds check completely removing nested unrolls
-            if nc < roi_col_lo or nc > roi_col_hi or nr < roi_row_lo or nr > roi_row_hi:
-                continue
+    # ------------------------------------------------------------------ #
+    # 3. Rasterize obstacle and line-cost bitmaps over the search frame    #
+    # ------------------------------------------------------------------ #
+    obstacle_grid = CellGrid(frame_col, frame_row, grid_w, grid_h)
+    line_grid = CellGrid(frame_col, frame_row, grid_w, grid_h)
+    if routing_cache:
+        if 'obstacles' in routing_cache:
+            obstacle_grid.merge(routing_cache['obstacles'])
+        if 'line_cells' in routing_cache:
+            line_grid.merge(routing_cache['line_cells'])
 
-            # Move Cost
-            move_cost = 1.0
-            if dir_idx != n_dir_idx:
-                move_cost += TURN_PENALTY
-            
-            nb = (nc, nr)
-            if nb in line_cells:
-                move_cost += CROSSOVER_PENALTY
-                
-            if nb in obstacles and nb != eg:
-                move_cost += 50000.0  # Soft obstacle penalty
-                
-            new_cost = cost + move_cost
-            state = (nc, nr, n_dir_idx)
-            
-            # Sub-millisecond cost dictionary lookup
-            if state in best_cost and new_cost >= best_cost[state]:
-                continue
-                
-            best_cost[state] = new_cost
-            parent[state] = (cc, cr, dir_idx)
-            
-            # Inline Manhattan Heuristic
-            f_score = new_cost + abs(nc - eg_c) + abs(nr - eg_r)
-            heapq.heappush(pq, (f_score, new_cost, nc, nr, n_dir_idx))
+    # We explicitly include start/end components. Because they are Soft Obstacles (50,000 cost),
+    # the pathfinder will immediately take the shortest route out to escape the penalty,
+    # which mathematically prevents lines from running a full length straight through them.
+    obstacle_grid.fill_spans([_rect_cell_span(rect) for rect in component_rects])
+
+    dyn_line_spans: List[Tuple[int, int, int, int]] = []
+    for p1, p2 in connection_segments:
+        dyn_line_spans.extend(_seg_cell_spans(p1, p2))
+    line_grid.fill_spans(dyn_line_spans)
+
+    # Fuse both bitmaps into one configuration-space grid so A* reads a single byte per cell.
+    # Flat column-major layout: cell (c, r) lives at (c - frame_col) * grid_h + (r - frame_row)
+    # The obstacle bitmap is per-call and not read again, so reinterpret its
+    # bytes in place (True == CELL_OBSTACLE) instead of copying them
+    cspace_grid = obstacle_grid.cells.view(np.uint8)
+    cspace_grid[line_grid.cells] |= CELL_LINE
+
+    # ------------------------------------------------------------------ #
+    # 4. A* Algorithm (Heuristic Search)                                 #
+    # ------------------------------------------------------------------ #
+    roi = (
+        roi_col_lo - frame_col,
+        roi_col_hi - frame_col,
+        roi_row_lo - frame_row,
+        roi_row_hi - frame_row,
+    )
+    local_sg = (sg[0] - frame_col, sg[1] - frame_row)
+    local_eg = (eg[0] - frame_col, eg[1] - frame_row)
+
+    # Fast path: an unobstructed straight line or single-turn L is already a
+    # minimum-cost route, so skip the search. Try the L leaving along start_side first.
+    horizontal_first = start_side not in ("top", "bottom")
+    local_path = (_clear_l_path(cspace_grid, roi, local_sg, local_eg, horizontal_first)
+                  or _clear_l_path(cspace_grid, roi, local_sg, local_eg, not horizontal_first))
+
+    if not local_path:
+        cspace = cspace_grid.tobytes(order='F')
+        local_path = _astar_search(cspace, grid_h, roi, local_sg, local_eg)
 
     # ------------------------------------------------------------------ #
     # 5. Reconstruct path or fall back                                     #
     # ------------------------------------------------------------------ #
-    if not found_state:
+    if not local_path:
         # Return empty list to let connection.py use its rule-based fallback
         return []
 
-    grid_path: List[Tuple[int, int]] = []
-    curr = found_state
-    while curr:
-        grid_path.append((curr[0], curr[1]))
-        curr = parent[curr]
-    grid_path.reverse()
+    grid_path = np.asarray(local_path, dtype=np.int32) + (frame_col, frame_row)
 
-    # Convert to world coords
-    world: List[QPointF] = [_to_world(c, r) for c, r in grid_path]
+    # Collapse straight runs on integer cells, then convert only the corners
+    world: List[QPointF] = [_to_world(c, r) for c, r in _grid_corners(grid_path)]
 
     # Segment Floating to ensure mathematically straight endpoints without doglegs.
-    world = _simplify(world)
 
     if len(world) == 2:
         is_horiz = abs(world[0].y() - world[1].y()) < 0.01
@@ -327,6 +527,21 @@ def find_path(
     return _simplify(world)
 
 
+def _grid_corners(grid_path: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Reduce a cell-by-cell grid path to its endpoints and direction-change cells.
+    Works on an (N, 2) int array so no QPointF is built for intermediate cells.
+    """
+    pts = np.asarray(grid_path, dtype=np.int32)
+    if len(pts) <= 2:
+        return [tuple(p) for p in pts.tolist()]
+
+    steps = np.diff(pts, axis=0)
+    turns = np.any(steps[1:] != steps[:-1], axis=1)
+    corners = np.concatenate((pts[:1], pts[1:-1][turns], pts[-1:]))
+    return [tuple(p) for p in corners.tolist()]
+
+
 def _simplify(pts: List[QPointF]) -> List[QPointF]:
     """
     Remove collinear intermediate points so only direction-change corners remain.
@@ -26,12 +26,16 @@ class AddCommand(QUndoCommand):
         if self.component not in self.canvas.components:
             self.canvas.components.append(self.component)
             self.component.show()
+            self.canvas.restore_selection(components=[self.component])
+            self.canvas.mark_dirty()
             self.canvas.update()
 
     def undo(self):
         if self.component in self.canvas.components:
             self.canvas.components.remove(self.component)
             self.component.hide()
+            self.canvas.drop_from_selection(components=[self.component])
+            self.canvas.mark_dirty()
             self.canvas.update()
 
 class AddConnectionCommand(QUndoCommand):
@@ -51,11 +55,15 @@ class AddConnectionCommand(QUndoCommand):
                 # Recalculate path with auto-routing enabled
                 self.connection.update_path(self.canvas.components, self.canvas.connections)
             
+            self.canvas.restore_selection(connections=[self.connection])
+            self.canvas.mark_dirty()
             self.canvas.update()
 
     def undo(self):
         if self.connection in self.canvas.connections:
             self.canvas.connections.remove(self.connection)
+            self.canvas.drop_from_selection(connections=[self.connection])
+            self.canvas.mark_dirty()
             self.canvas.update()
 
 class DeleteCommand(QUndoCommand):
@@ -67,23 +75,29 @@ class DeleteCommand(QUndoCommand):
         self.setText(f"Delete {len(components)} items")
 
     def redo(self):
-        for conn in self.connections:
-            if conn in self.canvas.connections:
-                self.canvas.connections.remove(conn)
+        # One filtering pass per list instead of a list.remove() per item
+        del_conns = set(self.connections)
+        del_comps = set(self.components)
+        self.canvas.connections[:] = [c for c in self.canvas.connections if c not in del_conns]
+        self.canvas.components[:] = [c for c in self.canvas.components if c not in del_comps]
         for comp in self.components:
-            if comp in self.canvas.components:
-                self.canvas.components.remove(comp)
-                comp.hide()
+            comp.hide()
+        self.canvas.drop_from_selection(self.components, self.connections)
+        self.canvas.mark_dirty()
         self.canvas.update()
 
     def undo(self):
+        present_comps = set(self.canvas.components)
         for comp in self.components:
-            if comp not in self.canvas.components:
+            if comp not in present_comps:
                 self.canvas.components.append(comp)
                 comp.show()
+        present_conns = set(self.canvas.connections)
         for conn in self.connections:
-            if conn not in self.canvas.connections:
+            if conn not in present_conns:
                 self.canvas.connections.append(conn)
+        self.canvas.restore_selection(self.components, self.connections)
+        self.canvas.mark_dirty()
         self.canvas.update()
 
 class MoveCommand(QUndoCommand):
@@ -213,11 +227,11 @@ def handle_close_event(canvas, event):
              delete_project(canvas.project_id)
         event.accept()
 
-def export_image(canvas, filename):
-    export_to_image(canvas, filename)
+def export_image(canvas, filename, on_finished=None):
+    export_to_image(canvas, filename, on_finished)
 
-def export_pdf(canvas, filename):
-    export_to_pdf(canvas, filename)
+def export_pdf(canvas, filename, on_finished=None):
+    export_to_pdf(canvas, filename, on_finished)
 
 def generate_report(canvas, filename):
     generate_report_pdf(canvas, filename)
@@ -3,10 +3,13 @@ Export utilities for canvas content.
 """
 import json
 import os
+import re
+from functools import lru_cache
+from operator import itemgetter
 import pandas as pd
 from PyQt5.QtCore import Qt, QRectF, QPoint, QSizeF, QSize
-from PyQt5.QtGui import QPainter, QImage, QPageSize, QRegion, QColor
-from PyQt5.QtWidgets import QWidget, QLabel
+from PyQt5.QtGui import QPainter, QImage, QPageSize, QRegion
+from PyQt5.QtWidgets import QWidget
 from PyQt5.QtPrintSupport import QPrinter
 from src.canvas import painter as canvas_painter
 from src.canvas import resources
@@ -14,6 +17,7 @@ from src.component_widget import ComponentWidget
 from src.connection import Connection
 import src.app_state as app_state
 from src.api_client import update_project, get_components
+from src.workers import run_in_pool
 
 # ---------------------- CANVAS STATE SERIALIZATION ----------------------
 # ✅ Module-level cache
@@ -151,8 +155,10 @@ def load_canvas_from_project(canvas, project_data):
     Expects project_data to have 'canvas_state' with items and connections.
     """
     try:
-        # Block auto-save during load
+        # Block auto-save during load, and coalesce the per-component repaints
+        # queued by show()/update_visuals() into one canvas repaint at the end
         canvas._is_loading = True
+        canvas.setUpdatesEnabled(False)
         canvas_state = project_data.get("canvas_state")
         if not canvas_state:
             print("[LOAD] No canvas_state in project data")
@@ -166,9 +172,9 @@ def load_canvas_from_project(canvas, project_data):
         # Clear existing canvas
         canvas.components = []
         canvas.connections = []
-        for c in canvas.children():
-            if isinstance(c, (ComponentWidget, QLabel)):
-                c.deleteLater()
+        canvas.selected_components.clear()
+        canvas.selected_connections.clear()
+        _clear_canvas_widgets(canvas)
         
         # Reset label counters to prevent sequence collisions
         canvas.label_data = resources.load_label_data(canvas.base_dir)
@@ -344,6 +350,7 @@ def load_canvas_from_project(canvas, project_data):
                 conn.update_path(canvas.components, canvas.connections)
                 canvas.connections.append(conn)
         
+        canvas.mark_dirty()
         canvas.update()
         return True
         
@@ -356,9 +363,20 @@ def load_canvas_from_project(canvas, project_data):
     finally:
         # Re-enable auto-save
         canvas._is_loading = False
+        canvas.setUpdatesEnabled(True)
     
 # ---------------------- HELPERS ----------------------
 
+def _clear_canvas_widgets(canvas):
+    """
+    Deletes every component and warning-label widget created on the canvas,
+    including hidden ones kept alive for undo. Walks the canvas's own list
+    instead of scanning all of its Qt children.
+    """
+    for w in canvas._component_widgets:
+        w.deleteLater()
+    canvas._component_widgets.clear()
+
 def _get_grip_side(component, grip_index):
     """
     Derive connection side from grip position.
@@ -393,25 +411,66 @@ def _get_grip_side(component, grip_index):
 
 def get_content_rect(canvas, padding=50):
     """Calculates the bounding rectangle of all canvas content."""
-    content_rect = QRectF()
+    # Track the bounds as scalars: component geometries plus a 1x1 box per
+    # connection path point, without building a QRectF per item to united()
+    min_x = min_y = float('inf')
+    max_x = max_y = float('-inf')
+
     for comp in canvas.components:
-        content_rect = content_rect.united(QRectF(comp.geometry()))
+        g = comp.geometry()
+        w, h = g.width(), g.height()
+        if not w and not h:
+            continue  # united() skips null rects
+        x, y = g.x(), g.y()
+        if x < min_x: min_x = x
+        if y < min_y: min_y = y
+        if x + w > max_x: max_x = x + w
+        if y + h > max_y: max_y = y + h
         
     for conn in canvas.connections:
         if not conn.path: continue
         for p in conn.path:
-            content_rect = content_rect.united(QRectF(p.x(), p.y(), 1, 1))
+            x, y = p.x(), p.y()
+            if x < min_x: min_x = x
+            if y < min_y: min_y = y
+            if x + 1 > max_x: max_x = x + 1
+            if y + 1 > max_y: max_y = y + 1
 
-    if content_rect.isEmpty():
+    # Same emptiness rule as QRectF.isEmpty(); also covers "no content at all" (inf bounds)
+    if not (max_x > min_x and max_y > min_y):
         return QRectF(canvas.rect())
         
-    content_rect.adjust(-padding, -padding, padding, padding)
-    return content_rect
+    return QRectF(min_x - padding, min_y - padding,
+                  max_x - min_x + 2 * padding, max_y - min_y + 2 * padding)
+
+# ---------------------- IMAGE BUFFER POOL ----------------------
+# Export renders are large (3-4x canvas size); reuse the buffer between
+# repeated exports of the same area instead of reallocating it each time.
+_IMAGE_POOL_SIZE = 2
+_image_pool = {}  # (width, height, format) -> QImage
+
+def _acquire_image(size, fmt=QImage.Format_ARGB32):
+    """Return a QImage of exactly `size`/`fmt`, reusing a pooled buffer when one matches."""
+    image = _image_pool.pop((size.width(), size.height(), fmt), None)
+    if image is None:
+        image = QImage(size, fmt)
+    return image
+
+def _release_image(image):
+    """Hand an image back to the pool once the caller is done with it."""
+    if image.isNull():
+        return
+    if len(_image_pool) >= _IMAGE_POOL_SIZE:
+        _image_pool.pop(next(iter(_image_pool)))
+    _image_pool[(image.width(), image.height(), image.format())] = image
 
-def render_to_image(canvas, rect, scale=1.0):
-    """Renders the specified canvas area to a QImage."""
+def render_to_image(canvas, rect, scale=1.0, fmt=QImage.Format_ARGB32):
+    """
+    Renders the specified canvas area to a QImage.
+    Pass the image to _release_image() when done so the buffer can be reused.
+    """
     img_size = rect.size().toSize() * scale
-    image = QImage(img_size, QImage.Format_ARGB32)
+    image = _acquire_image(img_size, fmt)
     image.fill(Qt.white)
     
     painter = QPainter(image)
@@ -432,8 +491,10 @@ def render_to_image(canvas, rect, scale=1.0):
         canvas_painter.draw_connections(painter, canvas.connections, canvas.components)
         painter.restore()
         
-        # Draw Components
+        # Draw Components (only those overlapping the exported area)
         for comp in canvas.components:
+            if not rect.intersects(QRectF(comp.geometry())):
+                continue
             painter.save()
             painter.translate(comp.pos())
             comp.render(painter, QPoint(), QRegion(), QWidget.DrawChildren)
@@ -442,58 +503,45 @@ def render_to_image(canvas, rect, scale=1.0):
         painter.end()
     return image
 
-def draw_equipment_table(painter, canvas, page_rect, start_y):
-    """Draws the equipment table on the painter."""
-    row_height = 35
-    w = page_rect.width()
-    col_widths = [w * 0.15, w * 0.25, w * 0.60]
-    headers = ["Sr. No.", "Tag Number", "Equipment Description"]
-    
-    # Headers
-    y = start_y
-    painter.setFont(QPainter().font())
-    f = painter.font()
-    f.setPointSize(10); f.setBold(True); painter.setFont(f)
-    
-    current_x = 0
-    for i, h in enumerate(headers):
-        r = QRectF(current_x, y, col_widths[i], row_height)
-        painter.setBrush(QColor("#e0e0e0")); painter.setPen(Qt.black)
-        painter.drawRect(r); painter.drawText(r, Qt.AlignCenter, h)
-        current_x += col_widths[i]
-    y += row_height
-    
-    # Data Preparation
-    equipment_list = []
-    for comp in canvas.components:
-        tag = comp.config.get("default_label", "")
-        name = comp.config.get("name", "")
-        if (not name or name == "Unknown Component") and getattr(comp, "svg_path", None):
-            name = os.path.splitext(os.path.basename(comp.svg_path))[0]
-            if name.startswith(("905", "907")): name = name[3:]
-            name = name.replace("_", " ").strip()
-        equipment_list.append((tag, name or "Unknown Component"))
-    equipment_list.sort(key=lambda x: x[0])
-    
-    # Draw Rows
-    f.setBold(False); painter.setFont(f)
-    for idx, (tag, name) in enumerate(equipment_list):
-        current_x = 0
-        vals = [str(idx+1), tag, name]
-        aligns = [Qt.AlignCenter, Qt.AlignCenter, Qt.AlignLeft | Qt.AlignVCenter]
-        
-        for i, val in enumerate(vals):
-            r = QRectF(current_x, y, col_widths[i], row_height)
-            painter.setBrush(Qt.NoBrush)
-            painter.drawRect(r)
-            rect_adj = r.adjusted(10,0,-10,0) if i==2 else r
-            painter.drawText(rect_adj, aligns[i], val)
-            current_x += col_widths[i]
-        y += row_height
+# Library numbering prefix on SVG filenames (e.g. "905_Centrifugal_Pump")
+_SVG_NAME_PREFIX = re.compile(r"^90[57]")
+
+@lru_cache(maxsize=1024)
+def _display_name(name, svg_path):
+    """
+    Equipment description for a component: its configured name, or one derived
+    from the SVG filename. Cached on the (name, svg_path) pair, so a renamed or
+    re-pointed component simply misses the cache.
+    """
+    if (not name or name == "Unknown Component") and svg_path:
+        name = os.path.splitext(os.path.basename(svg_path))[0]
+        name = _SVG_NAME_PREFIX.sub("", name).replace("_", " ").strip()
+    return name or "Unknown Component"
 
 # ---------------------- EXPORT FUNCTIONS ----------------------
-def export_to_image(canvas, filename):
-    """Export canvas to high-quality image with proper rendering"""
+def _start_export(job, image, on_finished=None):
+    """
+    Runs the encode/write half of an export on the thread pool; returns the
+    image to the pool once done. Only QImage/QPrinter painting happens off
+    the GUI thread, which Qt supports.
+    """
+    def _done(ok):
+        _release_image(image)
+        if on_finished:
+            on_finished(ok)
+
+    def _failed(e):
+        print(f"[EXPORT ERROR] {e}")
+        _done(False)
+
+    run_in_pool(lambda: bool(job()), _done, _failed)
+
+def export_to_image(canvas, filename, on_finished=None):
+    """
+    Export canvas to high-quality image with proper rendering.
+    The canvas is rendered on the GUI thread; encoding and writing the file run
+    in the background and on_finished(ok) is called when the file is written.
+    """
     # STRATEGY: 
     # 1. Save current zoom
     # 2. Reset zoom to 1.0 (This forces all components to render at logic size = visual size)
@@ -512,15 +560,53 @@ def export_to_image(canvas, filename):
         scale_factor = 3.0
         rect = get_content_rect(canvas)
         image = render_to_image(canvas, rect, scale=scale_factor)
-        image.save(filename, quality=100)
     finally:
         # 4. Restore Zoom
         if old_z != 1.0:
             canvas.zoom_level = old_z
             canvas.apply_zoom()
 
-def export_to_pdf(canvas, filename):
-    """Export canvas to high-quality PDF"""
+    _start_export(lambda: image.save(filename, quality=100), image, on_finished)
+
+def _write_pdf(image, rect, filename):
+    """Writes `image` as a single-page PDF sized to `rect`."""
+    # PDF Setup with HighResolution mode
+    printer = QPrinter(QPrinter.HighResolution)
+    printer.setOutputFormat(QPrinter.PdfFormat)
+    printer.setOutputFileName(filename)
+    
+    # Calculate size in millimeters for proper scaling
+    mm_per_inch = 25.4
+    # Use printer's resolution for accurate conversion
+    dpi = printer.resolution()
+    
+    s = rect.size()
+    w_mm = (s.width() / dpi) * mm_per_inch
+    h_mm = (s.height() / dpi) * mm_per_inch
+    
+    printer.setPageSize(QPageSize(QSizeF(w_mm, h_mm), QPageSize.Millimeter))
+    printer.setPageMargins(0, 0, 0, 0, QPrinter.Millimeter)
+    
+    painter = QPainter(printer)
+    try:
+        # Enable high-quality rendering
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.setRenderHint(QPainter.HighQualityAntialiasing)
+        
+        # Draw the high-res image to fill the page
+        target_rect = painter.viewport()
+        painter.drawImage(target_rect, image)
+    finally:
+        painter.end()
+    return True
+
+def export_to_pdf(canvas, filename, on_finished=None):
+    """
+    Export canvas to high-quality PDF.
+    Like export_to_image, the PDF is written in the background and
+    on_finished(ok) is called once it is complete.
+    """
     
     # STRATEGY: Reset Zoom to 1.0
     old_z = getattr(canvas, 'zoom_level', 1.0)
@@ -531,43 +617,16 @@ def export_to_pdf(canvas, filename):
     try:
         rect = get_content_rect(canvas)
         scale_factor = 4.0
-        image = render_to_image(canvas, rect, scale=scale_factor)
-        
-        # PDF Setup with HighResolution mode
-        printer = QPrinter(QPrinter.HighResolution)
-        printer.setOutputFormat(QPrinter.PdfFormat)
-        printer.setOutputFileName(filename)
-        
-        # Calculate size in millimeters for proper scaling
-        mm_per_inch = 25.4
-        # Use printer's resolution for accurate conversion
-        dpi = printer.resolution()
-        
-        s = rect.size()
-        w_mm = (s.width() / dpi) * mm_per_inch
-        h_mm = (s.height() / dpi) * mm_per_inch
-        
-        printer.setPageSize(QPageSize(QSizeF(w_mm, h_mm), QPageSize.Millimeter))
-        printer.setPageMargins(0, 0, 0, 0, QPrinter.Millimeter)
-        
-        painter = QPainter(printer)
-        try:
-            # Enable high-quality rendering
-            painter.setRenderHint(QPainter.Antialiasing)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            painter.setRenderHint(QPainter.HighQualityAntialiasing)
-            
-            # Draw the high-res image to fill the page
-            target_rect = painter.viewport()
-            painter.drawImage(target_rect, image)
-        finally:
-            painter.end()
+        # Opaque white background: skip the alpha channel the PDF never uses
+        image = render_to_image(canvas, rect, scale=scale_factor, fmt=QImage.Format_RGB32)
     finally:
         # Restore Zoom
         if old_z != 1.0:
             canvas.zoom_level = old_z
             canvas.apply_zoom()
 
+    _start_export(lambda: _write_pdf(image, rect, filename), image, on_finished)
+
 def generate_report_pdf(canvas, filename):
     """Generate professional PDF report using ReportLab"""
     try:
@@ -609,25 +668,20 @@ def generate_report_pdf(canvas, filename):
 
 def export_to_excel(canvas, filename):
     """Exports the list of equipment to an Excel file with auto-width columns."""
-    equipment_list = []
+    equipment_list = [None] * len(canvas.components)
     
-    # Logic similar to draw_equipment_table to extract data
     for idx, comp in enumerate(canvas.components):
         tag = comp.config.get("default_label", "")
-        name = comp.config.get("name", "")
-        if (not name or name == "Unknown Component") and getattr(comp, "svg_path", None):
-            name = os.path.splitext(os.path.basename(comp.svg_path))[0]
-            if name.startswith(("905", "907")): name = name[3:]
-            name = name.replace("_", " ").strip()
+        name = _display_name(comp.config.get("name", ""), getattr(comp, "svg_path", None))
             
-        equipment_list.append({
+        equipment_list[idx] = {
             "Sr. No.": idx + 1,
             "Tag Number": tag,
-            "Equipment Description": name or "Unknown Component"
-        })
+            "Equipment Description": name
+        }
         
     # Sort by Tag Number as in the table
-    equipment_list.sort(key=lambda x: x["Tag Number"])
+    equipment_list.sort(key=itemgetter("Tag Number"))
     
     # Re-assign Sr. No. after sort
     for i, item in enumerate(equipment_list):
@@ -657,17 +711,32 @@ def export_to_excel(canvas, filename):
             worksheet.set_column(idx, idx, max_len + 2)
 
 # ---------------------- PFD SERIALIZATION ----------------------
-def save_to_pfd(canvas, filename):
-    """Saves project in legacy .pfd format"""
-    import datetime
-    
-    items = []
-    comp_map = {c: i for i, c in enumerate(canvas.components)}
-    
+# orjson is an optional speed-up for large .pfd files; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(data):
+    """Parses JSON from bytes."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_encode(obj):
+    """Compact JSON encoding of `obj` as UTF-8 bytes."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _pfd_items(canvas, comp_ids):
+    """
+    Yields the .pfd item record for each canvas component, recording each
+    component's id in `comp_ids` along the way for _pfd_connections.
+    """
     for i, c in enumerate(canvas.components):
+        comp_ids[c] = i
         c_dict = c.to_dict()
         
-        item = {
+        yield {
             "id": i,
             "x": c_dict["x"],
             "y": c_dict["y"],
@@ -684,14 +753,14 @@ def save_to_pfd(canvas, filename):
             "config": c_dict["config"],
             "grips": c.get_grips()
         }
-        items.append(item)
 
-    connections = []
+def _pfd_connections(canvas, comp_ids):
+    """Yields the .pfd connection record for each canvas connection."""
     for i, c in enumerate(canvas.connections):
-        start_id = comp_map.get(c.start_component, -1)
-        end_id = comp_map.get(c.end_component, -1)
+        start_id = comp_ids.get(c.start_component, -1)
+        end_id = comp_ids.get(c.end_component, -1)
         
-        conn = {
+        yield {
             "id": i,
             "sourceItemId": start_id,
             "sourceGripIndex": c.start_grip_index,
@@ -703,51 +772,112 @@ def save_to_pfd(canvas, filename):
             "start_adjust": c.start_adjust,
             "end_adjust": c.end_adjust,
         }
-        connections.append(conn)
-
-    data = {
-        "version": "1.0.0",
-        "displayedAt": datetime.datetime.now().isoformat(),
-        "editorVersion": "1.0.0",
-        "canvasState": {
-            "items": items,
-            "connections": connections,
-            "sequenceCounter": len(items)
-        },
-        "viewport": {
-            "scale": getattr(canvas, "zoom_level", 1.0),
-            "position": {"x": 0, "y": 0}
-        },
-        "project": {
-            "id": "desktop-export",
-            "name": os.path.basename(filename).replace(".pfd", ""),
-            "createdAt": datetime.datetime.now().isoformat()
-        }
+
+def _write_json_array(f, records, encode):
+    """Writes records as a JSON array to a binary file, encoding one record at a time."""
+    f.write(b"[")
+    for i, record in enumerate(records):
+        if i:
+            f.write(b",")
+        f.write(encode(record))
+    f.write(b"]")
+
+def save_to_pfd(canvas, filename, pretty=False):
+    """
+    Saves project in legacy .pfd format.
+    Records are streamed compactly one at a time; pretty=True writes the
+    whole document indented instead.
+    """
+    import datetime
+    
+    now = datetime.datetime.now().isoformat()
+    viewport = {
+        "scale": getattr(canvas, "zoom_level", 1.0),
+        "position": {"x": 0, "y": 0}
     }
-        
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=4)
+    project = {
+        "id": "desktop-export",
+        "name": os.path.basename(filename).replace(".pfd", ""),
+        "createdAt": now
+    }
+
+    # Filled by the item pass, read by the connection pass
+    comp_ids = {}
+
+    if pretty:
+        items = list(_pfd_items(canvas, comp_ids))
+        data = {
+            "version": "1.0.0",
+            "displayedAt": now,
+            "editorVersion": "1.0.0",
+            "canvasState": {
+                "items": items,
+                "connections": list(_pfd_connections(canvas, comp_ids)),
+                "sequenceCounter": len(items)
+            },
+            "viewport": viewport,
+            "project": project
+        }
+        with open(filename, 'w') as f:
+            json.dump(data, f, indent=4)
+        return
+
+    encode = _json_encode
+    with open(filename, 'wb') as f:
+        f.write(b'{"version":"1.0.0","displayedAt":%s,"editorVersion":"1.0.0","canvasState":{"items":'
+                % encode(now))
+        _write_json_array(f, _pfd_items(canvas, comp_ids), encode)
+        f.write(b',"connections":')
+        _write_json_array(f, _pfd_connections(canvas, comp_ids), encode)
+        f.write(b',"sequenceCounter":%d},"viewport":%s,"project":%s}'
+                % (len(canvas.components), encode(viewport), encode(project)))
+
+def _pfd_sections(data):
+    """
+    Returns the (items, connections) record lists of a parsed .pfd document,
+    or None if it is not a recognizable .pfd file. Checking every record is a
+    dict up front lets the load loops use .get() on them without guarding.
+    """
+    if not isinstance(data, dict):
+        return None
+    if "canvasState" in data:
+        state = data["canvasState"]
+        if not isinstance(state, dict):
+            return None
+        items_data = state.get("items", [])
+        conns_data = state.get("connections", [])
+    elif "components" in data:
+        items_data = data.get("components", [])
+        conns_data = data.get("connections", [])
+    else:
+        return None
+
+    for records in (items_data, conns_data):
+        if not isinstance(records, list) or not all(isinstance(d, dict) for d in records):
+            return None
+    return items_data, conns_data
 
 def load_from_pfd(canvas, filename):
     """Load from legacy .pfd format"""
     if not os.path.exists(filename): return False
     try:
-        with open(filename, 'r') as f: data = json.load(f)
+        with open(filename, 'rb') as f: data = _json_loads(f.read())
         
-        canvas.components = []
-        canvas.connections = []
-        for c in canvas.children():
-            if isinstance(c, (ComponentWidget, QLabel)): c.deleteLater()
-            
-        if "canvasState" in data:
-            items_data = data["canvasState"].get("items", [])
-            conns_data = data["canvasState"].get("connections", [])
-        elif "components" in data:
-            items_data = data.get("components", [])
-            conns_data = data.get("connections", [])
-        else:
+        # Validate the document shape once, before the current canvas is cleared
+        sections = _pfd_sections(data)
+        if sections is None:
             print("Unknown file format")
             return False
+        items_data, conns_data = sections
+        
+        # Coalesce per-component repaints into one canvas repaint at the end
+        canvas.setUpdatesEnabled(False)
+        
+        canvas.components = []
+        canvas.connections = []
+        canvas.selected_components.clear()
+        canvas.selected_connections.clear()
+        _clear_canvas_widgets(canvas)
 
         id_map = {}
         
@@ -823,10 +953,13 @@ def load_from_pfd(canvas, filename):
                 c.update_path(canvas.components, canvas.connections)
                 canvas.connections.append(c)
                 
+        canvas.mark_dirty()
         canvas.update()
         return True
     except Exception as e:
         import traceback
         traceback.print_exc()
         print(f"Error loading PFD: {e}")
-        return False
\ No newline at end of file
+        return False
+    finally:
+        canvas.setUpdatesEnabled(True)
\ No newline at end of file
@@ -1,7 +1,9 @@
-from PyQt5.QtGui import QColor, QPen, QBrush
+from PyQt5.QtGui import QColor, QPen, QBrush, QPolygonF, QPainterPath
 from PyQt5.QtCore import Qt
 
-def draw_grid(painter, width, height, theme="light"):
+from src.connection import Connection
+
+def draw_grid(painter, width, height, theme="light", clip=None):
     dot_color = QColor(90, 90, 90) if theme == "dark" else QColor(180, 180, 180)
     painter.setPen(dot_color)
 
@@ -11,9 +13,17 @@ def draw_grid(painter, width, height, theme="light"):
     from PyQt5.QtGui import QPolygon
     from PyQt5.QtCore import QPoint
     
+    # Restrict to the dots inside the (logical) repaint area, if given
+    x0, y0, x1, y1 = 0, 0, width, height
+    if clip is not None:
+        x0 = max(0, int(clip.left()) // grid_spacing * grid_spacing)
+        y0 = max(0, int(clip.top()) // grid_spacing * grid_spacing)
+        x1 = min(width, int(clip.right()) + 1)
+        y1 = min(height, int(clip.bottom()) + 1)
+
     points = QPolygon()
-    for x in range(0, width, grid_spacing):
-        for y in range(0, height, grid_spacing):
+    for x in range(x0, x1, grid_spacing):
+        for y in range(y0, y1, grid_spacing):
             points.append(QPoint(x, y))
             
     painter.drawPoints(points)
@@ -24,16 +34,35 @@ def draw_connections(painter, connections, components, theme="light", zoom=1.0,
     layer="lines": only lines (draw behind components)
     layer="arrows": only arrowheads (draw on top)
     layer="all": everything (traditional)
+    Pen/brush state is set once per pass rather than per connection.
     """
-    for conn in connections:
-        conn.paint(painter, theme=theme, zoom=zoom, layer=layer)
+    if layer in ("all", "lines"):
+        painter.setPen(Connection.line_pen(theme))
+        painter.setBrush(Qt.NoBrush)
+        for conn in connections:
+            conn.paint_line(painter)
 
-        # Draw Edit Handles if selected
+    if layer in ("all", "arrows"):
+        arrow_pen, arrow_brush = Connection.arrow_style(theme, zoom)
+        painter.setPen(arrow_pen)
+        painter.setBrush(arrow_brush)
+        for conn in connections:
+            arrow_poly = conn.arrow_polygon(zoom)
+            if arrow_poly is not None:
+                painter.drawPolygon(arrow_poly)
+
+    # Edit Handles of selected connections, drawn in one call
+    handles = QPainterPath()
+    handles.setFillRule(Qt.WindingFill) # close handles must not cancel out
+    for conn in connections:
         if conn.is_selected:
-            painter.setBrush(QColor("#2563eb"))
-            painter.setPen(Qt.NoPen)
             for pt in conn.path:
-                painter.drawEllipse(pt, 4, 4)
+                handles.addEllipse(pt, 4, 4)
+
+    if not handles.isEmpty():
+        painter.setBrush(QColor("#2563eb"))
+        painter.setPen(Qt.NoPen)
+        painter.drawPath(handles)
 
 def draw_active_connection(painter, active_connection, theme="light", layer="all"):
     if active_connection:
@@ -44,10 +73,8 @@ def draw_active_connection(painter, active_connection, theme="light", layer="all
             
             if not active_connection.painter_path.isEmpty():
                 painter.drawPath(active_connection.painter_path)
-            else:
-                path = active_connection.path
-                for i in range(len(path) - 1):
-                    painter.drawLine(path[i], path[i + 1])
+            elif active_connection.path:
+                painter.drawPolyline(QPolygonF(active_connection.path))
         
         # ACTIVE connection usually doesn't show an arrow while dragging? 
         # But if it does, we'd handle it here for layer="arrows"
@@ -2,9 +2,14 @@ import os
 import json
 import csv
 import re
+from functools import lru_cache
 
+# Separators stripped when matching component / file names
+_CLEAN_TABLE = str.maketrans("", "", " ,_/-()")
+
+@lru_cache(maxsize=1024)
 def clean_string(s):
-    return s.lower().translate(str.maketrans("", "", " ,_/-()"))
+    return s.lower().translate(_CLEAN_TABLE)
 
 
 def format_component_label(legend, count, suffix):
@@ -49,7 +54,15 @@ def normalize_component_label(label, legend="", suffix=""):
     return label
 
 def load_label_data(base_dir):
-    label_data = {}
+    """Fresh per-canvas label counters; the asset files are only parsed once per base_dir."""
+    return {
+        key: {"legend": legend, "suffix": suffix, "count": 0}
+        for key, legend, suffix in _read_label_entries(base_dir)
+    }
+
+@lru_cache(maxsize=None)
+def _read_label_entries(base_dir):
+    entries = {}
     
     # Try loading from JSON cache first (New Single Source of Truth)
     json_path = os.path.join(base_dir, "ui", "assets", "components_cache.json")
@@ -61,12 +74,8 @@ def load_label_data(base_dir):
                     key = item.get("object", "").strip() or item.get("name", "").strip()
                     if not key: continue
                     
-                    label_data[clean_string(key)] = {
-                        "legend": item.get("legend", "").strip(),
-                        "suffix": item.get("suffix", "").strip(),
-                        "count": 0
-                    }
-            return label_data
+                    entries[clean_string(key)] = (item.get("legend", "").strip(), item.get("suffix", "").strip())
+            return tuple((key, legend, suffix) for key, (legend, suffix) in entries.items())
         except Exception as e:
             print("Failed to load components_cache.json:", e)
 
@@ -75,21 +84,28 @@ def load_label_data(base_dir):
         csv_path = os.path.join(base_dir, "ui", "assets", "Component_Details.csv")
         if os.path.exists(csv_path):
             with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
+                # Plain rows + column positions resolved once from the header,
+                # rather than a dict per row from DictReader
+                reader = csv.reader(f)
+                header = [h.strip() for h in next(reader, [])]
+                cols = [header.index(c) if c in header else None
+                        for c in ("object", "name", "legend", "suffix")]
                 for row in reader:
-                    key = row.get("object", "").strip() or row.get("name", "").strip()
+                    obj, name, legend, suffix = (
+                        row[i].strip() if i is not None and i < len(row) else ""
+                        for i in cols
+                    )
+                    key = obj or name
                     if not key: continue
 
-                    label_data[clean_string(key)] = {
-                        "legend": row.get("legend", "").strip(),
-                        "suffix": row.get("suffix", "").strip(),
-                        "count": 0
-                    }
+                    entries[clean_string(key)] = (legend, suffix)
     except Exception as e:
         print("Failed to load Component_Details.csv:", e)
-    return label_data
+    return tuple((key, legend, suffix) for key, (legend, suffix) in entries.items())
 
+@lru_cache(maxsize=None)
 def load_config(base_dir):
+    """grips.json keyed by component name. Parsed once per base_dir and shared: treat as read-only."""
     component_config = {}
     try:
         path = os.path.join(base_dir, "ui", "assets", "grips.json")
@@ -106,28 +122,49 @@ def find_svg_path(name, base_dir):
     # name = ID_MAP.get(name, name)
     
     svg_dir = os.path.join(base_dir, "ui", "assets", "svg")
-    target = clean_string(name)
 
     if not os.path.exists(svg_dir):
         print(f"SVG directory missing: {svg_dir}")
         return None
 
-    for root, _, files in os.walk(svg_dir):
-        for f in files:
-            if not f.lower().endswith(".svg"):
-                continue
-
-            fname = f[:-4]
-            # Direct match
-            if fname == name:
-                return os.path.join(root, f)
-            # Clean match
-            if clean_string(fname) == target:
-                return os.path.join(root, f)
+    # A direct stem match is also a clean match, so the first file (in walk
+    # order) whose cleaned stem matches is what a full scan would return
+    path = _svg_index(svg_dir)[0].get(clean_string(name))
+    if path:
+        return path
 
     print(f"No SVG found for: {name}")
     return None
 
+# svg_dir -> (directory mtimes, cleaned stem -> path, filename -> path)
+_svg_indexes = {}
+
+def _svg_index(svg_dir):
+    """
+    Index of every file under svg_dir, rebuilt only when one of its directories
+    changes (e.g. the component library downloads a new SVG).
+    """
+    cached = _svg_indexes.get(svg_dir)
+    if cached is not None:
+        try:
+            if all(os.stat(d).st_mtime_ns == m for d, m in cached[0].items()):
+                return cached[1], cached[2]
+        except OSError:
+            pass
+
+    dir_mtimes, by_clean, by_name = {}, {}, {}
+    for root, _, files in os.walk(svg_dir):
+        dir_mtimes[root] = os.stat(root).st_mtime_ns
+        for f in files:
+            path = os.path.join(root, f)
+            by_name.setdefault(f, path)
+            if f.lower().endswith(".svg"):
+                by_clean.setdefault(clean_string(f[:-4]), path)
+
+    if dir_mtimes:
+        _svg_indexes[svg_dir] = (dir_mtimes, by_clean, by_name)
+    return by_clean, by_name
+
 def get_component_config_by_name(name, component_config):
     # ID_MAP removed (Legacy)
     # name = ID_MAP.get(name, name)
@@ -166,8 +203,4 @@ def find_svg_file(filename, parent, base_dir):
         
     # Fallback: Search in all svg subdirectories
     svg_root = os.path.join(base_dir, "ui", "assets", "svg")
-    for root, _, files in os.walk(svg_root):
-        if filename in files:
-            return os.path.join(root, filename)
-            
-    return None
+    return _svg_index(svg_root)[1].get(filename)
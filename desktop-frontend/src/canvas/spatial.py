@@ -0,0 +1,67 @@
+"""
+Spatial index used by the canvas for hit-testing.
+"""
+from PyQt5.QtCore import QRectF
+
+
+class QuadTree:
+    """
+    Region quadtree over (QRectF, item) entries.
+    Entries that straddle a split line stay on the parent node, so every
+    entry is stored exactly once and queries never return duplicates.
+    """
+
+    def __init__(self, bounds, max_items=10, max_depth=8):
+        self.bounds = QRectF(bounds)
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.entries = []
+        self.children = None
+
+    def insert(self, rect, item):
+        node = self
+        while node.children is not None:
+            child = node._child_containing(rect)
+            if child is None:
+                break
+            node = child
+        node.entries.append((rect, item))
+        if node.children is None and len(node.entries) > node.max_items and node.max_depth > 0:
+            node._split()
+
+    def query(self, rect):
+        """Return the items whose rect intersects `rect`."""
+        found = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not node.bounds.intersects(rect):
+                continue
+            found.extend(item for r, item in node.entries if r.intersects(rect))
+            if node.children is not None:
+                stack.extend(node.children)
+        return found
+
+    def _child_containing(self, rect):
+        for child in self.children:
+            if child.bounds.contains(rect):
+                return child
+        return None
+
+    def _split(self):
+        b = self.bounds
+        w, h = b.width() / 2, b.height() / 2
+        depth = self.max_depth - 1
+        self.children = [
+            QuadTree(QRectF(b.x(), b.y(), w, h), self.max_items, depth),
+            QuadTree(QRectF(b.x() + w, b.y(), w, h), self.max_items, depth),
+            QuadTree(QRectF(b.x(), b.y() + h, w, h), self.max_items, depth),
+            QuadTree(QRectF(b.x() + w, b.y() + h, w, h), self.max_items, depth),
+        ]
+        entries, self.entries = self.entries, []
+        for rect, item in entries:
+            child = self._child_containing(rect)
+            if child is None:
+                self.entries.append((rect, item))
+            else:
+                child.insert(rect, item)
@@ -1,9 +1,9 @@
 import os
 from PyQt5 import QtWidgets, QtGui
-from PyQt5.QtCore import Qt, QPoint, QPointF, QRectF, QSize
+from PyQt5.QtCore import Qt, QPoint, QPointF, QRect, QRectF, QSize, QSizeF, QTimer
 from PyQt5.QtWidgets import QWidget, QLabel, QUndoStack
 from PyQt5.QtWidgets import QWidget, QLabel, QUndoStack, QVBoxLayout, QHBoxLayout, QPushButton, QFrame, QSizePolicy
-from PyQt5.QtGui import QPainter, QColor, QPalette
+from PyQt5.QtGui import QPainter, QColor, QPalette, QPolygonF
 
 from src.connection import Connection
 from src.component_widget import ComponentWidget
@@ -11,6 +11,12 @@ import src.app_state as app_state
 from src.canvas import resources, painter
 from src.canvas.commands import AddCommand, DeleteCommand, MoveCommand, AddConnectionCommand
 from src.canvas.validation import GraphValidator
+from src.canvas.spatial import QuadTree
+
+# Padding (logical px) of the hit-test index entries; matches Connection.hit_test
+# tolerance and the grip snapping box in update_connection_drag
+CONNECTION_HIT_PAD = 5.0
+GRIP_SNAP_PAD = 30.0
 
 
 class ConnectionOverlay(QWidget):
@@ -30,7 +36,7 @@ class ConnectionOverlay(QWidget):
         qp.scale(self.canvas.zoom_level, self.canvas.zoom_level)
         
         # PASS 2: DRAW ARROWHEADS ONLY (on top of components)
-        painter.draw_connections(qp, self.canvas.connections, self.canvas.components, 
+        painter.draw_connections(qp, self.canvas.connections_in(event.rect()), self.canvas.components, 
                                  theme=app_state.current_theme, zoom=self.canvas.zoom_level, 
                                  layer="arrows")
 
@@ -58,6 +64,27 @@ class CanvasWidget(QWidget):
         self.components = []
         self.connections = []
         self.active_connection = None
+        # Currently selected items (kept in sync with their is_selected flags)
+        self.selected_components = set()
+        self.selected_connections = set()
+        # Drag state, declared up front so mouse handlers never probe with hasattr
+        self.drag_connection = None
+        self.drag_item = None
+        self.drag_item_start_pos = QPointF()
+        self.routing_cache = None
+        # Every ComponentWidget / warning QLabel parented to this canvas (incl. hidden
+        # undo-stack ones), so loaders can tear them down without scanning children()
+        self._component_widgets = []
+        # Hit-test quadtree, rebuilt lazily after mark_dirty()
+        self._spatial = None
+
+        # Connection drags are re-routed at most once per frame (~60 Hz); mouse
+        # moves in between only record the latest position
+        self._pending_move_pos = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._flush_move)
 
         # PROJECT TRACKING
         self.project_id = None
@@ -103,26 +130,26 @@ class CanvasWidget(QWidget):
         validator = GraphValidator(self.components, self.connections)
         self.validation_errors = validator.validate()
         
+        loops = set(self.validation_errors["loops"])
+        flow_errors = set(self.validation_errors["flow_errors"])
+        
         # Update component error states
         for comp in self.components:
-            comp.is_valid = True
-            comp.validation_error_msg = ""
-            
             error_msgs = []
-            if comp in self.validation_errors["loops"]:
-                comp.is_valid = False
+            if comp in loops:
                 error_msgs.append("Circular loop detected.")
-            if comp in self.validation_errors["flow_errors"]:
-                comp.is_valid = False
+            if comp in flow_errors:
                 error_msgs.append("Component has no inlet or outlet connections.")
-                
-            if error_msgs:
-                comp.validation_error_msg = "\n".join(error_msgs)
             
-            comp.update() # Trigger repaint to show/hide error styling
+            is_valid = not error_msgs
+            msg = "\n".join(error_msgs)
+            if comp.is_valid != is_valid or comp.validation_error_msg != msg:
+                comp.is_valid = is_valid
+                comp.validation_error_msg = msg
+                comp.update() # Trigger repaint to show/hide error styling
 
-        # Trigger re-paint on the main canvas (e.g. for global warning indicators)
-        self.update()
+        # Error styling is drawn by the components themselves; the canvas paints
+        # nothing validation-dependent, so it does not need a repaint here
 
     def expand_to_contain(self, rect):
         """Expand logical size if rect is outside current bounds."""
@@ -262,6 +289,70 @@ class CanvasWidget(QWidget):
     def clear_routing_cache(self):
         self.routing_cache = None
 
+    # ---------------------- HIT-TEST INDEX ----------------------
+    def mark_dirty(self, item=None):
+        """Invalidate the hit-test index after `item` (or the scene) changed."""
+        # The connection being drawn is not part of the scene yet
+        if item is not None and item is self.active_connection:
+            return
+        self._spatial = None
+
+    def _spatial_index(self):
+        if self._spatial is not None:
+            return self._spatial
+
+        entries = []
+        for order, conn in enumerate(self.connections):
+            if len(conn.path) < 2:
+                continue
+            rect = QPolygonF(conn.path).boundingRect().adjusted(
+                -CONNECTION_HIT_PAD, -CONNECTION_HIT_PAD, CONNECTION_HIT_PAD, CONNECTION_HIT_PAD)
+            entries.append((rect, (0, order, conn)))
+        for order, comp in enumerate(self.components):
+            rect = comp.logical_rect.adjusted(-GRIP_SNAP_PAD, -GRIP_SNAP_PAD, GRIP_SNAP_PAD, GRIP_SNAP_PAD)
+            entries.append((rect, (1, order, comp)))
+
+        bounds = QRectF()
+        for rect, _ in entries:
+            bounds = bounds.united(rect)
+        self._spatial = QuadTree(bounds, max_items=10, max_depth=8)
+        for rect, entry in entries:
+            self._spatial.insert(rect, entry)
+        return self._spatial
+
+    def _indexed_in(self, rect, kind):
+        """Indexed items of `kind` (0 = connection, 1 = component) touching `rect`, in scene order."""
+        hits = [(order, item) for k, order, item in self._spatial_index().query(rect) if k == kind]
+        hits.sort(key=lambda hit: hit[0])
+        return [item for _, item in hits]
+
+    def _hit_candidates(self, pos, kind):
+        """Indexed items of `kind` near `pos`, in scene order."""
+        return self._indexed_in(QRectF(pos - QPointF(0.5, 0.5), QSizeF(1, 1)), kind)
+
+    # ---------------------- DAMAGE / CULLING ----------------------
+    def _paint_margin(self):
+        """Logical distance a connection's drawing can stick out of its path points."""
+        # Jump arcs (6) + pen (2) scale with zoom; arrowheads are a constant 15 visual px
+        return 8.0 + 15.0 / max(0.1, self.zoom_level)
+
+    def connections_in(self, visual_rect):
+        """Connections that may draw inside `visual_rect` (widget coordinates), in scene order."""
+        z = self.zoom_level
+        m = self._paint_margin()
+        logical = QRectF(visual_rect.x() / z, visual_rect.y() / z,
+                         visual_rect.width() / z, visual_rect.height() / z).adjusted(-m, -m, m, m)
+        return self._indexed_in(logical, 0)
+
+    def _connection_damage_rect(self, conn):
+        """Widget-space rect covering everything drawn for `conn`."""
+        if not conn or len(conn.path) < 2:
+            return QRect()
+        z = self.zoom_level
+        m = self._paint_margin()
+        r = QPolygonF(conn.path).boundingRect().adjusted(-m, -m, m, m)
+        return QRectF(r.x() * z, r.y() * z, r.width() * z, r.height() * z).toAlignedRect()
+
     # ---------------------- DRAG & DROP ----------------------
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
@@ -305,11 +396,37 @@ class CanvasWidget(QWidget):
         event.acceptProposedAction()
 
     def deselect_all(self):
-        for comp in self.components:
+        for comp in list(self.selected_components):
             comp.set_selected(False)
-        for conn in self.connections:
-            conn.is_selected = False
-        self.update()
+        deselected = list(self.selected_connections)
+        for conn in deselected:
+            self.set_connection_selected(conn, False)
+        self.invalidate_connections(deselected)
+
+    def drop_from_selection(self, components=(), connections=()):
+        """Items leaving the scene stop counting as selected (their flag is kept for undo)."""
+        self.selected_components.difference_update(components)
+        self.selected_connections.difference_update(connections)
+
+    def restore_selection(self, components=(), connections=()):
+        """Re-register items coming back into the scene that are still flagged selected."""
+        self.selected_components.update(c for c in components if c.is_selected)
+        self.selected_connections.update(c for c in connections if c.is_selected)
+
+    def set_connection_selected(self, conn, selected):
+        conn.is_selected = selected
+        if selected:
+            self.selected_connections.add(conn)
+        else:
+            self.selected_connections.discard(conn)
+
+    def invalidate_connections(self, connections):
+        """Schedule a repaint of just the area drawn by `connections`."""
+        rect = QRect()
+        for conn in connections:
+            rect = rect.united(self._connection_damage_rect(conn))
+        if not rect.isEmpty():
+            self.update(rect)
 
     def start_connection(self, component, grip_index, side):
         """Called by ComponentWidget when a port is clicked."""
@@ -319,7 +436,6 @@ class CanvasWidget(QWidget):
         # Position the end point at the start point initially
         self.active_connection.current_pos = self.active_connection.get_start_pos()
         self.build_routing_cache() 
-        self.update()
 
     def get_logical_pos(self, pos):
         """Convert screen (visual) pos to logical pos."""
@@ -336,7 +452,7 @@ class CanvasWidget(QWidget):
             # Connection hit test
             hit_connection = None
             hit_index = -1
-            for conn in self.connections:
+            for conn in self._hit_candidates(logical_pos, 0):
                 # CONNECTION HIT TEST uses LOGICAL coordinates
                 # Ensure connection class is updated or we pass logical logic
                 idx = conn.hit_test(logical_pos)
@@ -347,10 +463,10 @@ class CanvasWidget(QWidget):
 
             if hit_connection:
                 # Select the connection but disable manual dragging
-                hit_connection.is_selected = True
+                self.set_connection_selected(hit_connection, True)
 
                 self.setFocus()
-                self.update()
+                self.invalidate_connections([hit_connection])
                 event.accept()
                 return
 
@@ -376,13 +492,23 @@ class CanvasWidget(QWidget):
         logical_pos = self.get_logical_pos(event.pos())
         
         if self.active_connection:
-            self.update_connection_drag(logical_pos) # Pass logical
-            # Don't call super() here because QWidget default doesn't care
-            # But sticky notes might? No, they are widgets.
+            self.queue_connection_drag(logical_pos)
             return super().mouseMoveEvent(event)
 
         super().mouseMoveEvent(event)
 
+    def queue_connection_drag(self, pos):
+        """Record a LOGICAL drag position; it is applied on the next frame tick."""
+        self._pending_move_pos = pos
+        if not self._move_timer.isActive():
+            self._move_timer.start()
+
+    def _flush_move(self):
+        """Apply the latest coalesced mouse move to the connection being drawn."""
+        pos, self._pending_move_pos = self._pending_move_pos, None
+        if pos is not None and self.active_connection:
+            self.update_connection_drag(pos) # Pass logical
+
     def update_connection_drag(self, pos):
         # POS is in LOGICAL coordinates
         if not self.active_connection:
@@ -393,7 +519,7 @@ class CanvasWidget(QWidget):
         best_dist = 20.0 # Standard tolerance (Logical)
         best_grip = None
 
-        for comp in self.components:
+        for comp in self._hit_candidates(pos, 1):
             # Check bounding box (in logical)
             if not comp.logical_rect.adjusted(-30, -30, 30, 30).contains(pos):
                 continue
@@ -402,27 +528,15 @@ class CanvasWidget(QWidget):
             if comp == self.active_connection.start_component:
                 continue
 
-            grips = comp.get_grips()
-            # Grip positions need to be mapped to logical!
-            # comp.get_grip_position returns coordinate relative to Widget (0,0) top left
-            # Widget top-left LOGICAL is comp.logical_rect.topLeft()
-            # So Global Logical Grip = comp.logical_rect.topLeft() + GripOffset
-             
-            for i, _ in enumerate(grips):
-                # We need the logical grip position relative to component 
-                # Since get_grip_position relies on SVG rect which scales...
-                # Actually, comp.get_grip_position() returns pixel offsest at current size
-                # We need to un-scale it to get logical offset.
-                
-                visual_grip_pos = comp.get_grip_position(i) # Visual offset
-                logical_grip_offset = QPointF(visual_grip_pos.x() / self.zoom_level, visual_grip_pos.y() / self.zoom_level)
-                
-                center = comp.logical_rect.topLeft() + logical_grip_offset
-                
-                dist = (pos - center).manhattanLength()
+            # Grip offsets are cached per component (logical, relative to its top-left)
+            origin = comp.logical_rect.topLeft()
+            ox, oy = origin.x(), origin.y()
+            px, py = pos.x(), pos.y()
+            for i, (gx, gy, side) in enumerate(comp.get_snap_grip_offsets()):
+                dist = abs(px - ox - gx) + abs(py - oy - gy)
                 if dist < best_dist:
                     best_dist = dist
-                    best_grip = (comp, i, grips[i]["side"])
+                    best_grip = (comp, i, side)
                     snap = True
 
         if snap and best_grip:
@@ -433,9 +547,10 @@ class CanvasWidget(QWidget):
             self.active_connection.clear_snap_target()
             self.active_connection.current_pos = pos 
 
-        routing_cache = getattr(self, "routing_cache", None)
-        self.active_connection.update_path(self.components, self.connections, routing_cache=routing_cache)
-        self.update()
+        old_rect = self._connection_damage_rect(self.active_connection)
+        self.active_connection.update_path(self.components, self.connections, routing_cache=self.routing_cache)
+        # Only the area the dashed preview left and entered needs repainting
+        self.update(old_rect.united(self._connection_damage_rect(self.active_connection)))
 
     def mouseReleaseEvent(self, event):
         # Handle release in LOGICAL coords
@@ -444,7 +559,7 @@ class CanvasWidget(QWidget):
         self.drag_connection = None
         self.clear_routing_cache()
 
-        if hasattr(self, 'drag_item') and self.drag_item:
+        if self.drag_item is not None:
             moved_comp = self.drag_item
             if moved_comp.logical_rect.topLeft() != self.drag_item_start_pos:
                 cmd = MoveCommand(moved_comp, self.drag_item_start_pos, moved_comp.logical_rect.topLeft())
@@ -461,9 +576,11 @@ class CanvasWidget(QWidget):
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Escape:
             if self.active_connection:
+                self._move_timer.stop()
+                self._pending_move_pos = None
+                self.invalidate_connections([self.active_connection])
                 self.active_connection = None
                 self.clear_routing_cache()
-                self.update()
             else:
                 self.deselect_all()
         elif event.key() in (Qt.Key_Delete, Qt.Key_Backspace):
@@ -472,16 +589,21 @@ class CanvasWidget(QWidget):
             super().keyPressEvent(event)
 
     def delete_selected_components(self):
-        to_del_comps = [c for c in self.components if c.is_selected]
-        to_del_conns = [c for c in self.connections if c.is_selected]
+        if not self.selected_components and not self.selected_connections:
+            return
+
+        # Canvas order keeps undo (which re-appends) deterministic
+        to_del_comps = [c for c in self.components if c in self.selected_components]
+        to_del_conns = [c for c in self.connections if c in self.selected_connections]
 
-        attached_conns = []
-        for i in range(len(self.connections) - 1, -1, -1):
-            conn = self.connections[i]
-            if (conn.start_component in to_del_comps or 
-                conn.end_component in to_del_comps):
-                if conn not in to_del_conns and conn not in attached_conns:
-                    attached_conns.append(conn)
+        # Sets keep the attached-connection scan linear for bulk deletes
+        del_comps = set(to_del_comps)
+        del_conns = set(to_del_conns)
+        attached_conns = [
+            conn for conn in reversed(self.connections)
+            if (conn.start_component in del_comps or conn.end_component in del_comps)
+            and conn not in del_conns
+        ]
 
         all_conns_to_del = to_del_conns + attached_conns
 
@@ -493,8 +615,13 @@ class CanvasWidget(QWidget):
         self.update()
 
     def handle_connection_release(self, pos):
+        # Snap to wherever the last (possibly still pending) move ended up
+        self._move_timer.stop()
+        self._flush_move()
         self.clear_routing_cache()
         if self.active_connection:
+            # Erase the dashed preview; a committed connection repaints via its command
+            self.invalidate_connections([self.active_connection])
             if self.active_connection.snap_component:
                 self.active_connection.set_end_grip(
                     self.active_connection.snap_component,
@@ -509,7 +636,6 @@ class CanvasWidget(QWidget):
             
             self.active_connection = None
             self.run_validation()
-            self.update()
 
     # ---------------------- PAINT EVENT ----------------------
     def paintEvent(self, event):
@@ -523,16 +649,21 @@ class CanvasWidget(QWidget):
         logical_w = int(self.width() / self.zoom_level)
         logical_h = int(self.height() / self.zoom_level)
         
+        # Only the damaged area is repainted; cull everything outside it
+        damaged = event.rect()
+        z = self.zoom_level
+        logical_clip = QRectF(damaged.x() / z, damaged.y() / z, damaged.width() / z, damaged.height() / z)
         
-        painter.draw_grid(qp, logical_w, logical_h, app_state.current_theme)
+        painter.draw_grid(qp, logical_w, logical_h, app_state.current_theme, clip=logical_clip)
         
         # PASS 1: DRAW LINES ONLY (behind components)
-        painter.draw_connections(qp, self.connections, self.components, theme=app_state.current_theme, zoom=self.zoom_level, layer="lines")
+        painter.draw_connections(qp, self.connections_in(damaged), self.components, theme=app_state.current_theme, zoom=self.zoom_level, layer="lines")
         painter.draw_active_connection(qp, self.active_connection, theme=app_state.current_theme, layer="lines")
         
-        # Trigger overlay update (Pass 2 happens in Overlay.paintEvent)
+        # Pass 2 happens in Overlay.paintEvent: Qt repaints the (transparent) overlay
+        # over the same damaged area, so it must not be update()d from here, which
+        # would re-dirty the canvas and repaint it forever
         self.overlay.raise_() # Ensure it's on top of components
-        self.overlay.update()
 
     # ---------------------- COMPONENT CREATION ----------------------
     def create_component_command(self, text, pos, component_data=None):
@@ -609,6 +740,7 @@ class CanvasWidget(QWidget):
             print(f"[CANVAS WARNING] No SVG found for {text} (File: {svg_file})")
             
             lbl = QLabel(label_text, self)
+            self._component_widgets.append(lbl)
             # Position at scaled pos
             v_x = int(pos.x() * self.zoom_level)
             v_y = int(pos.y() * self.zoom_level)
@@ -650,9 +782,9 @@ class CanvasWidget(QWidget):
         cmd = AddCommand(self, comp, logical_pos)
         self.undo_stack.push(cmd)
         self.run_validation()
-    def export_to_pdf(self, filename):
+    def export_to_pdf(self, filename, on_finished=None):
         from src.canvas.commands import export_pdf
-        export_pdf(self, filename)
+        export_pdf(self, filename, on_finished)
 
     def generate_report(self, filename):
         from src.canvas.commands import generate_report
@@ -727,6 +859,6 @@ class CanvasWidget(QWidget):
         from src.canvas.commands import handle_close_event
         handle_close_event(self, event)
 
-    def export_to_image(self, filename):
+    def export_to_image(self, filename, on_finished=None):
         from src.canvas.commands import export_image
-        export_image(self, filename)
+        export_image(self, filename, on_finished)
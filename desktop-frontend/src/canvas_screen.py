@@ -1,6 +1,6 @@
 import os
 from PyQt5 import QtWidgets
-from PyQt5.QtGui import QColor, QBrush, QKeySequence
+from PyQt5.QtGui import QColor, QBrush, QKeySequence, QPainter
 from PyQt5.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QShortcut, QMdiSubWindow, QSplitter
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 
@@ -49,6 +49,48 @@ class OverlayContainer(QWidget):
         layout.setContentsMargins(0, 0, 20, 20)
 
 
+class ScaledPixmapLabel(QtWidgets.QLabel):
+    """
+    QLabel that paints a smooth-scaled copy of its pixmap.
+    The copy is built once per zoom step, on the first paint at that scale,
+    and blitted as-is by every later paint (scrolling, window moves, ...).
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._scale = 1.0
+        self._scaled = None
+
+    def set_scaled_pixmap(self, pixmap, scale):
+        if pixmap is not self._source or scale != self._scale:
+            self._scaled = None
+        self._source = pixmap
+        self._scale = scale
+        self.setMinimumSize(pixmap.size() * scale)
+        self.update()
+
+    def _scaled_pixmap(self):
+        if self._scaled is None:
+            if self._scale == 1.0:
+                self._scaled = self._source
+            else:
+                # Area-averaged, so the supersampled export stays clean when fit to window
+                self._scaled = self._source.scaled(
+                    self._source.size() * self._scale, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return self._scaled
+
+    def paintEvent(self, event):
+        if self._source is None or self._source.isNull():
+            super().paintEvent(event)
+            return
+
+        pixmap = self._scaled_pixmap()
+        target = pixmap.rect()
+        target.moveCenter(self.rect().center())
+        painter = QPainter(self)
+        painter.drawPixmap(target.topLeft(), pixmap)
+        painter.end()
+
 class ImageSubWindow(QMdiSubWindow):
     def __init__(self, image_path, parent=None):
         super().__init__(parent)
@@ -63,7 +105,7 @@ class ImageSubWindow(QMdiSubWindow):
         self.scroll_area.setWidgetResizable(True)
         self.setWidget(self.scroll_area)
         
-        self.image_label = QtWidgets.QLabel()
+        self.image_label = ScaledPixmapLabel()
         self.image_label.setAlignment(Qt.AlignCenter)
         self.scroll_area.setWidget(self.image_label)
         
@@ -73,7 +115,7 @@ class ImageSubWindow(QMdiSubWindow):
         from PyQt5.QtGui import QPixmap
         self.original_pixmap = QPixmap(self.image_path)
         if not self.original_pixmap.isNull():
-            self.image_label.setPixmap(self.original_pixmap)
+            self.image_label.set_scaled_pixmap(self.original_pixmap, self.scale_factor)
         else:
             self.image_label.setText("Failed to load image.")
 
@@ -122,12 +164,7 @@ class ImageSubWindow(QMdiSubWindow):
 
     def update_image_size(self):
         if self.original_pixmap and not self.original_pixmap.isNull():
-            new_size = self.original_pixmap.size() * self.scale_factor
-            self.image_label.setPixmap(
-                self.original_pixmap.scaled(
-                    new_size, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                )
-            )
+            self.image_label.set_scaled_pixmap(self.original_pixmap, self.scale_factor)
 
 class PDFSubWindow(QMdiSubWindow):
     def __init__(self, pdf_path, parent=None):
@@ -682,15 +719,13 @@ class CanvasScreen(QMainWindow):
             if filter_type.startswith("PDF") or filename.lower().endswith(".pdf"):
                 if not filename.lower().endswith(".pdf"):
                     filename += ".pdf"
-                canvas.export_to_pdf(filename)
-                QtWidgets.QMessageBox.information(self, "Success", f"Saved to {filename}")
+                canvas.export_to_pdf(filename, lambda ok: self._report_export(ok, filename))
                 return True
                 
             elif filter_type.startswith("JPEG") or filename.lower().endswith(".jpg"):
                 if not filename.lower().endswith(".jpg"):
                     filename += ".jpg"
-                canvas.export_to_image(filename)
-                QtWidgets.QMessageBox.information(self, "Success", f"Saved to {filename}")
+                canvas.export_to_image(filename, lambda ok: self._report_export(ok, filename))
                 return True
 
             else:
@@ -705,6 +740,13 @@ class CanvasScreen(QMainWindow):
             QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save file:\n{str(e)}")
             return False
 
+    def _report_export(self, ok, filename):
+        """Called once a background image/PDF export has finished writing."""
+        if ok:
+            QtWidgets.QMessageBox.information(self, "Success", f"Saved to {filename}")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save file:\n{filename}")
+
     def on_open_file(self):
         options = QtWidgets.QFileDialog.Options()
         filename, filter_type = QtWidgets.QFileDialog.getOpenFileName(
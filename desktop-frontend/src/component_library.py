@@ -2,18 +2,24 @@ import os
 import csv
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import src.app_state as app_state
 from src.theme_manager import theme_manager
 from src import api_client
 from src.flow_layout import FlowLayout
 from PyQt5.QtCore import Qt, QMimeData, QSize, QTimer, QPropertyAnimation, QEasingCurve, QEvent, pyqtSignal
-from PyQt5.QtGui import QIcon, QDrag, QMovie, QPixmap, QPalette
+from PyQt5.QtGui import QIcon, QDrag, QMovie, QPixmap, QPalette, QImageReader
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLineEdit, QFrame, QSizePolicy,
     QScrollArea, QLabel, QToolButton, QGridLayout, QLabel, QApplication, QGraphicsOpacityEffect, QHBoxLayout
 )
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Concurrent asset downloads during a sync (matches the session's connection pool)
+DOWNLOAD_WORKERS = 8
 
 class FunctionEvent(QEvent):
     EVENT_TYPE = QEvent.Type(QEvent.registerEventType())
@@ -97,11 +103,17 @@ class FlowContainer(QWidget):
         super().resizeEvent(event)
 
 class ComponentButton(QToolButton):
+    # icon_path -> QIcon / 32px drag pixmap, shared across buttons and reloads
+    _ICON_CACHE = {}
+    _DRAG_PIXMAPS = {}
+
     def __init__(self, component_data, icon_path, parent=None):
         super().__init__(parent)
         self.component_data = component_data
-        
-        if os.path.exists(icon_path):
+        self.icon_path = icon_path
+
+        icon = ComponentButton._ICON_CACHE.get(icon_path)
+        if icon is None and os.path.exists(icon_path):
             pix = QPixmap(icon_path)
             pix.setDevicePixelRatio(2.0)
             # print(icon_path, pix.width(), pix.height())
@@ -110,7 +122,10 @@ class ComponentButton(QToolButton):
                 Qt.KeepAspectRatio,
                 Qt.FastTransformation
             )
-            self.setIcon(QIcon(pix))
+            icon = QIcon(pix)
+            ComponentButton._ICON_CACHE[icon_path] = icon
+        if icon is not None:
+            self.setIcon(icon)
             self.setIconSize(QSize(42, 42))
 
         # BADGE for added components
@@ -177,11 +192,24 @@ class ComponentButton(QToolButton):
         mimeData.setText(component_json)
         drag.setMimeData(mimeData)
         
-        if not self.icon().isNull():
-            drag.setPixmap(self.icon().pixmap(32, 32))
+        drag_pixmap = self._drag_pixmap()
+        if not drag_pixmap.isNull():
+            drag.setPixmap(drag_pixmap)
         
         drag.exec_(Qt.CopyAction)
 
+    def _drag_pixmap(self):
+        """32px drag image, decoded straight at that size on first drag of this icon."""
+        pix = ComponentButton._DRAG_PIXMAPS.get(self.icon_path)
+        if pix is None:
+            reader = QImageReader(self.icon_path)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(32, 32, Qt.KeepAspectRatio))
+            pix = QPixmap.fromImage(reader.read())
+            ComponentButton._DRAG_PIXMAPS[self.icon_path] = pix
+        return pix
+
 
 class ComponentLibrary(QWidget):
     def __init__(self, parent=None):
@@ -196,6 +224,31 @@ class ComponentLibrary(QWidget):
         self.icon_buttons = []
         self.category_widgets = []
 
+        # Indexes over component_data, rebuilt by _index_components when it changes:
+        # (parent, name) -> first matching row, and parent -> rows sorted by name
+        self._rows_by_key = {}
+        self._grouped = {}
+        self._rows_index_src = (None, 0)
+        # (parent, name, obj) -> resolved icon path ("" when unavailable),
+        # dropped together with the indexes above
+        self._icon_path_cache = {}
+
+        # Set while a background sync runs; screens and the Sync button can
+        # all ask for one, but only one should hit the backend at a time
+        self._sync_in_progress = False
+
+        # Asset folders already created, and per-populate folder listings,
+        # so hundreds of components sharing a folder cost one syscall
+        self._ensured_dirs = set()
+        self._dir_listings = {}
+
+        # One pooled, keep-alive session for all asset downloads (same backend host)
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+
         # Connect to global theme manager
         theme_manager.theme_changed.connect(self.on_theme_changed)
         
@@ -264,7 +317,12 @@ class ComponentLibrary(QWidget):
         
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search components...")
-        self.search_box.textChanged.connect(self._filter_icons)
+        # Debounced: a burst of keystrokes runs one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self._filter_icons(self.search_box.text()))
+        self.search_box.textChanged.connect(self._filter_timer.start)
         main_layout.addWidget(self.search_box)
         
         self.scroll_area = QScrollArea()
@@ -306,6 +364,7 @@ class ComponentLibrary(QWidget):
                 return
 
             new_data = []
+            downloads = {}  # target (type, folder, file) -> job; one writer per file
             for comp in api_components:
                 s_no = str(comp.get("s_no", "")).strip()
                 if not s_no:
@@ -321,9 +380,9 @@ class ComponentLibrary(QWidget):
                 parent_folder = self.FOLDER_MAP.get(parent, parent)
 
                 if png_url:
-                    self._download_asset(png_url, png_filename, "png", parent_folder)
+                    downloads.setdefault(("png", parent_folder, png_filename), (png_url, png_filename, "png", parent_folder))
                 if svg_url:
-                    self._download_asset(svg_url, svg_filename, "svg", parent_folder)
+                    downloads.setdefault(("svg", parent_folder, svg_filename), (svg_url, svg_filename, "svg", parent_folder))
 
                 new_data.append({
                     "s_no": s_no,
@@ -337,14 +396,19 @@ class ComponentLibrary(QWidget):
                     "grips": comp.get("grips", ""),
                 })
 
+            # Download assets if missing, several at a time (requests releases the GIL on I/O)
+            if downloads:
+                with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+                    list(pool.map(lambda job: self._download_asset(*job), downloads.values()))
+
             # Sort by s_no
             try:
                 new_data.sort(key=lambda x: int(x["s_no"]) if x["s_no"].isdigit() else x["s_no"])
             except Exception:
                 pass
 
-            # Replace component_data atomically
-            self.component_data = new_data
+            # Replace component_data atomically (deduplicated here, once per sync)
+            self.component_data = self._dedupe_components(new_data)
             print(f"[SYNC] Loaded {len(new_data)} components from API.")
 
         except Exception as e:
@@ -362,55 +426,78 @@ class ComponentLibrary(QWidget):
                 url = f"{app_state.BACKEND_BASE_URL}{url}"
 
             target_dir = os.path.join("ui", "assets", asset_type, parent_folder)
-            os.makedirs(target_dir, exist_ok=True)
+            self._ensure_dir(target_dir)
             target_path = os.path.join(target_dir, filename)
 
             # Only download if missing 
             # (Optimization: We could check file size or headers, but 'exists' is safe for now)
             if not os.path.exists(target_path):
-                res = requests.get(url, timeout=5)
-                if res.status_code == 200:
-                    with open(target_path, "wb") as f:
-                        f.write(res.content)
-                    # print(f"[SYNC] Downloaded {asset_type}: {filename}")
-                else:
-                    print(f"[SYNC WARNING] Failed to download {url} ({res.status_code})")
+                status = self._fetch_to_file(url, target_path)
+                if status != 200:
+                    print(f"[SYNC WARNING] Failed to download {url} ({status})")
+                # else: print(f"[SYNC] Downloaded {asset_type}: {filename}")
         except Exception as e:
             print(f"[SYNC ERROR] Failed to download asset {filename}: {e}")
 
+    def _ensure_dir(self, path):
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _listing(self, path):
+        """File names in path, scanned once per _populate_icons pass."""
+        names = self._dir_listings.get(path)
+        if names is None:
+            with os.scandir(path) as it:
+                names = {entry.name for entry in it}
+            self._dir_listings[path] = names
+        return names
+
+    def _fetch_to_file(self, url, target_path):
+        """
+        Stream url to target_path without holding the whole body in memory.
+        Writes to a .part file renamed on success, so an interrupted download
+        never leaves a truncated asset that later 'exists' checks would trust.
+        Returns the HTTP status code.
+        """
+        tmp_path = target_path + ".part"
+        with self._http.get(url, timeout=5, stream=True) as res:
+            if res.status_code != 200:
+                return res.status_code
+            try:
+                with open(tmp_path, "wb") as f:
+                    for chunk in res.iter_content(65536):
+                        f.write(chunk)
+                os.replace(tmp_path, target_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        return 200
+
 
     def _populate_icons(self):
-        for i in reversed(range(self.scroll_layout.count())):
-            w = self.scroll_layout.itemAt(i).widget()
+        # Rebuild with painting off so the scroll area relayouts once at the end
+        self.scroll_widget.setUpdatesEnabled(False)
+        try:
+            self._rebuild_icons()
+        finally:
+            self.scroll_widget.setUpdatesEnabled(True)
+
+    def _rebuild_icons(self):
+        # Pull the old categories out of the layout now and free them with a
+        # single deleteLater, instead of one per widget left in the layout
+        discarded = QWidget()
+        while self.scroll_layout.count():
+            w = self.scroll_layout.takeAt(0).widget()
             if w:
-                w.deleteLater()
+                w.setParent(discarded)
+        discarded.deleteLater()
         
         self.icon_buttons.clear()
         self.category_widgets.clear()
+        self._dir_listings.clear()
         
-        grouped = {}
-        seen_components = set()
-        
-        for component in self.component_data:
-            parent = component['parent']
-            name = component['name']
-            
-            unique_key = (parent, name, component.get('object', ''))
-            
-            if unique_key in seen_components:
-                continue
-            
-            seen_components.add(unique_key)
-            
-            # Additional check: If name is "Filter" in "Fittings", only allow one
-            if parent == "Fittings" and name == "Filter":
-                filter_key = ("Fittings", "Filter")
-                if any(key[:2] == filter_key for key in seen_components if key != unique_key):
-                    continue
-            
-            if parent not in grouped:
-                grouped[parent] = []
-            grouped[parent].append(component)
+        grouped = self._index_components()
         
         for parent_name in sorted(grouped.keys()):
             category_label = QLabel(parent_name)
@@ -437,11 +524,12 @@ class ComponentLibrary(QWidget):
             # row, col = 0, 0
             # max_cols = 3  # Changed to 3 columns
             category_cards = []
+            search_keys = []  # (lowercase name, card) for _filter_icons
             
-            for component in sorted(grouped[parent_name], key=lambda x: x['name']):
+            for component in grouped[parent_name]:
                 icon_path = self._get_icon_path(parent_name, component['name'], component.get('object', ''))
                 
-                if os.path.exists(icon_path):
+                if icon_path:
                     # --- Create Card Frame ---
                     card = QFrame()
                     card.setObjectName("componentCard")
@@ -462,7 +550,6 @@ class ComponentLibrary(QWidget):
                     label = QLabel(component['name'])
                     label.setWordWrap(True)
                     label.setAlignment(Qt.AlignCenter)
-                    label.setStyleSheet("border: none; background: transparent; font-size: 10px;")
                     card_layout.addWidget(label)
                     
                     # grid_layout.addWidget(card, row, col)
@@ -470,6 +557,7 @@ class ComponentLibrary(QWidget):
                     
                     self.icon_buttons.append(button)
                     category_cards.append(card)
+                    search_keys.append((component['name'].lower(), card))
                     
                     # col += 1
                     # if col >= max_cols:
@@ -483,7 +571,9 @@ class ComponentLibrary(QWidget):
                     'label': category_label,
                     'grid': grid_widget,
                     'cards': category_cards,
-                    'name': parent_name
+                    'name': parent_name,
+                    'search_name': parent_name.lower(),
+                    'search_keys': search_keys
                 })
 
     def event(self, e):
@@ -499,32 +589,82 @@ class ComponentLibrary(QWidget):
         "Size Reduction Equipments": "Size Reduction Equipements"
     }
 
+    @staticmethod
+    def _dedupe_components(components):
+        """Keep the first row per (parent, name, object); one "Filter" in "Fittings"."""
+        unique = []
+        seen_components = set()
+        for component in components:
+            parent = component['parent']
+            name = component['name']
+            if parent == "Fittings" and name == "Filter":
+                unique_key = (parent, name)
+            else:
+                unique_key = (parent, name, component.get('object', ''))
+            if unique_key in seen_components:
+                continue
+            seen_components.add(unique_key)
+            unique.append(component)
+        return unique
+
+    def _index_components(self):
+        """
+        Build the lookup and display indexes in one pass over component_data.
+        Rebuilt only when component_data is replaced (sync) or resized;
+        returns parent -> components sorted by name.
+        """
+        src = (id(self.component_data), len(self.component_data))
+        if src == self._rows_index_src:
+            return self._grouped
+
+        rows_by_key = {}
+        grouped = {}
+        for component in self.component_data:
+            rows_by_key.setdefault((component['parent'], component['name']), component)
+            grouped.setdefault(component['parent'], []).append(component)
+
+        for components in grouped.values():
+            components.sort(key=lambda x: x['name'])
+
+        self._rows_by_key = rows_by_key
+        self._grouped = grouped
+        self._icon_path_cache.clear()
+        self._rows_index_src = src
+        return grouped
+
+    def _row_for(self, parent, name):
+        """O(1) lookup of the first component_data row for (parent, name)."""
+        self._index_components()
+        return self._rows_by_key.get((parent, name))
+
     def _get_icon_path(self, parent, name, obj=''):
-        csv_row = None
-        for c in self.component_data:
-            if c["parent"] == parent and c["name"] == name:
-                csv_row = c
-                break
+        self._index_components()
+        key = (parent, name, obj)
+        path = self._icon_path_cache.get(key)
+        if path is None:
+            path = self._icon_path_cache[key] = self._resolve_icon_path(parent, name)
+        return path
+
+    def _resolve_icon_path(self, parent, name):
+        csv_row = self._row_for(parent, name)
 
         backend_png_filename = csv_row.get("png", "") if csv_row else ""
 
         folder = self.FOLDER_MAP.get(parent, parent)
         local_dir = os.path.join("ui", "assets", "png", folder)
-        os.makedirs(local_dir, exist_ok=True)
+        self._ensure_dir(local_dir)
 
         if backend_png_filename:
             local_path = os.path.join(local_dir, backend_png_filename)
 
-            if os.path.exists(local_path):
+            if backend_png_filename in self._listing(local_dir):
                 return local_path
 
             backend_url = f"{app_state.BACKEND_BASE_URL}/media/components/{backend_png_filename}"
 
             try:
-                r = requests.get(backend_url, timeout=5)
-                if r.status_code == 200:
-                    with open(local_path, "wb") as f:
-                        f.write(r.content)
+                if self._fetch_to_file(backend_url, local_path) == 200:
+                    self._listing(local_dir).add(backend_png_filename)
                     return local_path
             except Exception as e:
                 print("[IMG FETCH ERROR]", e)
@@ -535,29 +675,23 @@ class ComponentLibrary(QWidget):
     def _filter_icons(self, search_text):
         search_text = search_text.lower()
         
-        if not search_text:
-            for category in self.category_widgets:
-                category['label'].setVisible(True)
-                category['grid'].setVisible(True)
-                for card in category['cards']:
-                    card.setVisible(True)
-            return
-        
+        # Match on the lowercase names captured in _populate_icons, and only
+        # touch widgets whose visibility actually flips
         for category in self.category_widgets:
-            has_match = False
+            category_match = search_text in category['search_name']
+            has_match = category_match
             
-            for card in category['cards']:
-                component = card.property('component_name').lower()
-                category_name = card.property('category').lower()
-                
-                matches = search_text in component or search_text in category_name
-                card.setVisible(matches)
+            for component, card in category['search_keys']:
+                matches = category_match or search_text in component
+                if card.isHidden() == matches:
+                    card.setVisible(matches)
                 
                 if matches:
                     has_match = True
             
-            category['label'].setVisible(has_match)
-            category['grid'].setVisible(has_match)
+            if category['label'].isHidden() == has_match:
+                category['label'].setVisible(has_match)
+                category['grid'].setVisible(has_match)
 
     def _show_update_toast(self):
         toast = ToastMessage(self, "Components updated from backend")
@@ -569,6 +703,9 @@ class ComponentLibrary(QWidget):
         Async reload with loading animation.
         Ensures loader is visible for at least 1 second.
         """
+        if self._sync_in_progress:
+            return
+        self._sync_in_progress = True
         self._show_loader()
 
         import time
@@ -589,6 +726,7 @@ class ComponentLibrary(QWidget):
             QApplication.instance().postEvent(
                 self,
                 FunctionEvent(lambda: (
+                    setattr(self, "_sync_in_progress", False),
                     self._populate_icons(),
                     self._hide_loader(),
                     self._show_update_toast(),
@@ -842,13 +980,13 @@ class ComponentLibrary(QWidget):
             }}
         """)
 
-        # Force Style Recompute
+        # Force Style Recompute (setStyleSheet already repolishes every child)
         self.style().unpolish(self)
         self.style().polish(self)
-        
-        for child in self.findChildren(QWidget):
-            child.style().unpolish(child)
-            child.style().polish(child)
+
+    def closeEvent(self, event):
+        self._http.close()
+        super().closeEvent(event)
 
     def changeEvent(self, event):
         """Detect system theme changes."""
@@ -1,17 +1,30 @@
 import os
+import math
 
 import json
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtSvg import QSvgRenderer
-from PyQt5.QtCore import Qt, QRectF, QPoint, QPointF
-from PyQt5.QtGui import QPainter, QPen, QColor
+from PyQt5.QtCore import Qt, QRect, QRectF, QPoint, QPointF, QTimer
+from PyQt5.QtGui import QPainter, QPen, QColor, QPixmap, QPixmapCache, QTransform
 
 class ComponentWidget(QWidget):
+    # svg_path -> QSvgRenderer; every instance of the same symbol shares one parsed DOM
+    _RENDERERS = {}
+    # (radius, rgba, dpr) -> pre-rasterised port dot, shared by all widgets
+    _PORT_PIXMAPS = {}
+
     def __init__(self, svg_path, parent=None, config=None):
         super().__init__(parent)
+        # Register with the canvas so project loads can delete it directly
+        tracked = getattr(parent, "_component_widgets", None)
+        if tracked is not None:
+            tracked.append(self)
         self.svg_path = svg_path
         self.config = config or {}
-        self.renderer = QSvgRenderer(svg_path)
+        self.renderer = ComponentWidget._RENDERERS.get(svg_path)
+        if self.renderer is None:
+            self.renderer = QSvgRenderer(svg_path)
+            ComponentWidget._RENDERERS[svg_path] = self.renderer
 
         # Dynamic size based on SVG dimensions
         default_size = self.renderer.defaultSize()
@@ -29,6 +42,8 @@ class ComponentWidget(QWidget):
         self.hover_port = None
         self.is_selected = False
         self.drag_start_global = None
+        self._pending_drag_global = None
+        self._drag_timer = None  # created on first drag, see mouseMoveEvent
         
         self.rotation_angle = 0
         self.drag_start_positions = {}
@@ -44,8 +59,13 @@ class ComponentWidget(QWidget):
         # Cache for grips to prevent file reading lag during paint events
         self._cached_grips = None
         
-        # Cache for actual SVG render rectangle
-        self._cached_svg_rect = None
+        # Grip geometry (widget-space port centres and logical snap offsets),
+        # keyed on the (width, height, zoom, label) it was computed for
+        self._grip_points = []
+        self._grip_xy = []          # same centres as plain int tuples for hover tests
+        self._grip_hover_box = None  # (x0, y0, x1, y1) around all ports, hover radius included
+        self._grip_offsets = []
+        self._grip_cache_key = None
 
         self.setAttribute(Qt.WA_Hover, True)
         self.setMouseTracking(True)
@@ -258,12 +278,23 @@ class ComponentWidget(QWidget):
 
         # Calculate actual SVG render rectangle
         svg_rect = self.calculate_svg_rect(content_rect)
-        self._cached_svg_rect = svg_rect  # Cache it for grip calculations
+
+        # Hover changes only invalidate the ports involved (see _port_rect),
+        # so skip the layers the damaged rect does not reach
+        dirty = event.rect()
 
         import src.app_state as app_state
 
-        # Render SVG (no opaque background — connections route around components)
-        self.renderer.render(painter, svg_rect)
+        # Render SVG (no opaque background — connections route around components).
+        # On screen this is a blit of the cached raster; scaled painters (export)
+        # still get the vector render so they stay sharp.
+        if not dirty.intersects(svg_rect.toAlignedRect()):
+            pass
+        elif painter.deviceTransform().type() <= QTransform.TxTranslate:
+            origin = QPointF(math.floor(svg_rect.x()), math.floor(svg_rect.y()))
+            painter.drawPixmap(origin, self._svg_pixmap(svg_rect, painter.device().devicePixelRatioF()))
+        else:
+            self.renderer.render(painter, svg_rect)
 
         # Selection Border — drawn INSET so it stays within widget clip rect
         if self.is_selected:
@@ -296,18 +327,40 @@ class ComponentWidget(QWidget):
             painter.setPen(QPen(label_color))
             # Draw label in the reserved bottom strip
             text_rect = QRectF(0, self.height() - self.LABEL_H, self.width(), self.LABEL_H)
-            painter.drawText(text_rect, Qt.AlignCenter, self.config['default_label'])
+            if dirty.intersects(text_rect.toAlignedRect()):
+                painter.drawText(text_rect, Qt.AlignCenter, self.config['default_label'])
 
         # Draw Ports using SVG coordinate mapping
-        grips = self.get_grips()
-        for idx, grip in enumerate(grips):
-            self.draw_dynamic_port(painter, grip, idx, svg_rect)
-
-    def draw_dynamic_port(self, painter, grip, idx, svg_rect):
-        """Draw port based on SVG viewBox coordinate mapping"""
-        pos = self.map_svg_to_widget_coords(grip["x"], grip["y"], svg_rect)
-        center = QPoint(int(pos.x()), int(pos.y()))
+        for idx, center in enumerate(self._grip_geometry()):
+            if dirty.intersects(self._port_rect(idx)):
+                self.draw_dynamic_port(painter, center, idx)
 
+    def _svg_pixmap(self, svg_rect, dpr):
+        """
+        SVG rasterised for svg_rect, shared through QPixmapCache by every
+        widget showing the same symbol at the same size.
+        The pixmap starts at svg_rect's integer top-left and keeps its
+        fractional offset, so blitting it matches a direct render.
+        """
+        dx = svg_rect.x() - math.floor(svg_rect.x())
+        dy = svg_rect.y() - math.floor(svg_rect.y())
+        key = "svg|%s|%.3f|%.3f|%.3f|%.3f|%.2f" % (
+            self.svg_path, dx, dy, svg_rect.width(), svg_rect.height(), dpr)
+        pix = QPixmapCache.find(key)
+        if pix is None:
+            pix = QPixmap(math.ceil((dx + svg_rect.width()) * dpr),
+                          math.ceil((dy + svg_rect.height()) * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.Antialiasing)
+            self.renderer.render(p, QRectF(dx, dy, svg_rect.width(), svg_rect.height()))
+            p.end()
+            QPixmapCache.insert(key, pix)
+        return pix
+
+    def draw_dynamic_port(self, painter, center, idx):
+        """Draw port at its precomputed widget-space centre"""
         radius = 4 if self.hover_port == idx else 3
         color = QColor("#22c55e") if self.hover_port == idx else QColor("cyan")
         
@@ -323,29 +376,90 @@ class ComponentWidget(QWidget):
         # User feedback: "grips only showing" - implying component is gone.
         # But reducing grip size will help clutter.
         
+        if painter.deviceTransform().type() <= QTransform.TxTranslate:
+            # Pixmap carries a 1px antialiasing fringe around the dot
+            pix = self._port_pixmap(scaled_radius, color, painter.device().devicePixelRatioF())
+            painter.drawPixmap(center.x() - scaled_radius - 1, center.y() - scaled_radius - 1, pix)
+            return
+
         painter.setBrush(color)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(center, scaled_radius, scaled_radius)
 
-    def get_grip_position(self, idx):
-        """Get grip position using SVG coordinate mapping"""
-        grips = self.get_grips()
+    @classmethod
+    def _port_pixmap(cls, radius, color, dpr):
+        """Port dot of `radius` rasterised once and blitted for every port."""
+        key = (radius, color.rgba(), dpr)
+        pix = cls._PORT_PIXMAPS.get(key)
+        if pix is None:
+            size = 2 * radius + 2
+            pix = QPixmap(math.ceil(size * dpr), math.ceil(size * dpr))
+            pix.setDevicePixelRatio(dpr)
+            pix.fill(Qt.transparent)
+            p = QPainter(pix)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setBrush(color)
+            p.setPen(Qt.NoPen)
+            p.drawEllipse(QPoint(radius + 1, radius + 1), radius, radius)
+            p.end()
+            cls._PORT_PIXMAPS[key] = pix
+        return pix
+
+    def _port_rect(self, idx):
+        """Widget rect covering port `idx` at its hovered (largest) size."""
+        zoom = 1.0
+        if self.parent() and hasattr(self.parent(), "zoom_level"):
+            zoom = self.parent().zoom_level
+        r = max(2, int(4 * zoom)) + 1  # + antialiasing fringe
+        c = self._grip_geometry()[idx]
+        return QRect(c.x() - r, c.y() - r, 2 * r + 1, 2 * r + 1)
 
-        if 0 <= idx < len(grips):
-            grip = grips[idx]
-            
-            # Use cached SVG rect if available, otherwise calculate
-            if self._cached_svg_rect:
-                svg_rect = self._cached_svg_rect
+    def _grip_geometry(self):
+        """
+        Widget-space port centres, one QPoint per grip.
+        Recomputed only when the widget size, zoom or label changes, so paint,
+        hover and routing never redo the SVG coordinate mapping.
+        """
+        zoom = 1.0
+        if self.parent() and hasattr(self.parent(), "zoom_level"):
+            zoom = self.parent().zoom_level
+
+        key = (self.width(), self.height(), zoom, bool(self.config.get('default_label')))
+        if self._grip_cache_key != key:
+            svg_rect = self.calculate_svg_rect(self.get_content_rect())
+            points, sides = [], []
+            for grip in self.get_grips():
+                pos = self.map_svg_to_widget_coords(grip["x"], grip["y"], svg_rect)
+                points.append(QPoint(int(pos.x()), int(pos.y())))
+                sides.append(grip["side"])
+            self._grip_points = points
+            self._grip_xy = [(p.x(), p.y()) for p in points]
+            if points:
+                xs = [x for x, _ in self._grip_xy]
+                ys = [y for _, y in self._grip_xy]
+                self._grip_hover_box = (min(xs) - 10, min(ys) - 10, max(xs) + 10, max(ys) + 10)
             else:
-                content_rect = self.get_content_rect()
-                svg_rect = self.calculate_svg_rect(content_rect)
-            
-            pos = self.map_svg_to_widget_coords(grip["x"], grip["y"], svg_rect)
-            return QPoint(int(pos.x()), int(pos.y()))
+                self._grip_hover_box = None
+            self._grip_offsets = [(p.x() / zoom, p.y() / zoom, side)
+                                  for p, side in zip(points, sides)]
+            self._grip_cache_key = key
+        return self._grip_points
 
+    def get_grip_position(self, idx):
+        """Get grip position using SVG coordinate mapping"""
+        points = self._grip_geometry()
+        if 0 <= idx < len(points):
+            return QPoint(points[idx])
         return QPoint(0, 0)
 
+    def get_snap_grip_offsets(self):
+        """
+        (x, y, side) for every grip, with x/y the LOGICAL offset from
+        logical_rect.topLeft() of the visual port centre (get_grip_position / zoom).
+        """
+        self._grip_geometry()
+        return self._grip_offsets
+
     def get_logical_grip_position(self, idx):
         """
         Get grip position in LOGICAL coordinates (unscaled).
@@ -391,6 +505,12 @@ class ComponentWidget(QWidget):
     # SELECTION
     def set_selected(self, selected: bool):
         self.is_selected = selected
+        selection = getattr(self.parent(), "selected_components", None)
+        if selection is not None:
+            if selected:
+                selection.add(self)
+            else:
+                selection.discard(self)
         self.update()
 
     # MOUSE PRESS
@@ -410,13 +530,13 @@ class ComponentWidget(QWidget):
             # SELECTION HANDLING
             # Deselect all other components - only one can be selected at a time
             if self.parent() and hasattr(self.parent(), "components"):
-                for comp in self.parent().components:
+                selection = getattr(self.parent(), "selected_components", None)
+                for comp in list(selection if selection is not None else self.parent().components):
                     if comp != self:
                         comp.set_selected(False)
             
             # Select this component
-            self.is_selected = True
-            self.update()
+            self.set_selected(True)
 
             if self.parent():
                 self.parent().setFocus()
@@ -426,8 +546,11 @@ class ComponentWidget(QWidget):
             
             # Record start positions for Undo
             if self.parent() and hasattr(self.parent(), "components"):
+                selection = getattr(self.parent(), "selected_components", None)
+                if selection is None:
+                    selection = [c for c in self.parent().components if c.is_selected]
                 self.drag_start_positions = {
-                    c: QPointF(c.logical_rect.topLeft()) for c in self.parent().components if c.is_selected
+                    c: QPointF(c.logical_rect.topLeft()) for c in selection
                 }
                 
                 moved_comps = list(self.drag_start_positions.keys())
@@ -441,14 +564,18 @@ class ComponentWidget(QWidget):
     # MOUSE MOVE
     def mouseMoveEvent(self, event):
         # If drawing connection, forward movement to canvas
-        if hasattr(self.parent(), "active_connection") and self.parent().active_connection:
+        if getattr(self.parent(), "active_connection", None):
             g = self.mapToGlobal(event.pos())
             parent_pos = self.parent().mapFromGlobal(g)
             if hasattr(self.parent(), "update_connection_drag"):
                 # Must convert to LOGICAL coordinates for the canvas
                 if hasattr(self.parent(), "get_logical_pos"):
                     logical_pos = self.parent().get_logical_pos(parent_pos)
-                    self.parent().update_connection_drag(logical_pos)
+                    # Coalesced to one re-route per frame when the canvas supports it
+                    if hasattr(self.parent(), "queue_connection_drag"):
+                        self.parent().queue_connection_drag(logical_pos)
+                    else:
+                        self.parent().update_connection_drag(logical_pos)
                 else:
                     self.parent().update_connection_drag(parent_pos)
             return
@@ -458,25 +585,23 @@ class ComponentWidget(QWidget):
         prev = self.hover_port
         self.hover_port = None
 
-        grips = self.get_grips()
-        
-        # Use cached SVG rect if available
-        if self._cached_svg_rect:
-            svg_rect = self._cached_svg_rect
-        else:
-            content_rect = self.get_content_rect()
-            svg_rect = self.calculate_svg_rect(content_rect)
-
-        for idx, grip in enumerate(grips):
-            grip_pos = self.map_svg_to_widget_coords(grip["x"], grip["y"], svg_rect)
-            center = QPoint(int(grip_pos.x()), int(grip_pos.y()))
-
-            if (pos - center).manhattanLength() < 10:
-                self.hover_port = idx
-                break
+        px, py = pos.x(), pos.y()
+        self._grip_geometry()
+        box = self._grip_hover_box
+        if box and box[0] < px < box[2] and box[1] < py < box[3]:
+            for idx, (gx, gy) in enumerate(self._grip_xy):
+                # Plain int math: no temporary QPoints per grip on every hover move
+                if abs(px - gx) + abs(py - gy) < 10:
+                    self.hover_port = idx
+                    break
 
         if prev != self.hover_port:
-            self.update()
+            # Repaint just the port(s) whose highlight changed
+            dirty = QRect()
+            for idx in (prev, self.hover_port):
+                if idx is not None:
+                    dirty = dirty.united(self._port_rect(idx))
+            self.update(dirty)
 
         # DRAGGING (with threshold to prevent jitter on click)
         if event.buttons() & Qt.LeftButton and self.drag_start_global:
@@ -487,62 +612,85 @@ class ComponentWidget(QWidget):
             if delta.manhattanLength() < 3:
                 return
 
-            parent = self.parent()
-            if parent and hasattr(parent, "components"):
-                # move all selected
-                for comp in parent.components:
-                    if comp.is_selected:
-                        # Update LOGICAL position
-                        # new_pos is visual. Convert to logical.
-                        z = parent.zoom_level if hasattr(parent, "zoom_level") else 1.0
-                        
-                        # We calculate delta in logical space
-                        logical_delta = delta / z
-                        
-                        # Update logical rect position
-                        comp.logical_rect.translate(logical_delta.x(), logical_delta.y())
-                        
-                        # Update visuals from logical
-                        comp.update_visuals(z)
-                        
-                        # Auto-Expand
-                        if hasattr(parent, "expand_to_contain"):
-                            parent.expand_to_contain(comp.logical_rect)
-                        
-                # Recalculate paths for connections attached to moved components
-                if hasattr(parent, "connections"):
-                    moved = {c for c in parent.components if c.is_selected}
-                    routing_cache = getattr(parent, "routing_cache", None)
-                    moved_conns = []
-                    for conn in parent.connections:
-                        if conn.start_component in moved or conn.end_component in moved:
-                            conn.update_path(parent.components, parent.connections, routing_cache=routing_cache)
-                            moved_conns.append(conn)
+            # Coalesced: every move since the last frame is applied as one step
+            self._pending_drag_global = curr_global
+            if self._drag_timer is None:
+                self._drag_timer = QTimer(self)
+                self._drag_timer.setSingleShot(True)
+                self._drag_timer.setInterval(16)
+                self._drag_timer.timeout.connect(self._flush_drag)
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
+
+    def _flush_drag(self):
+        """Move the selection to the latest coalesced drag position."""
+        curr_global, self._pending_drag_global = self._pending_drag_global, None
+        if curr_global is None or not self.drag_start_global:
+            return
+        delta = curr_global - self.drag_start_global
+
+        parent = self.parent()
+        if parent and hasattr(parent, "components"):
+            # move all selected (recorded in drag_start_positions on press)
+            for comp in self.drag_start_positions:
+                if comp.is_selected:
+                    # Update LOGICAL position
+                    # new_pos is visual. Convert to logical.
+                    z = parent.zoom_level if hasattr(parent, "zoom_level") else 1.0
                     
-                    # Update jumps ONLY for the connections that just moved to eliminate drag lag.
-                    # Full cross-canvas intersection sweep is deferred until mouseRelease.
-                    for conn in moved_conns:
-                        conn._generate_jump_path(parent.connections)
-                        
-                # Force full repaint — prevents stale connection artefacts
-                parent.repaint()
-            else:
-                 # Single item move (fallback)
-                 z = self.parent().zoom_level if (self.parent() and hasattr(self.parent(), "zoom_level")) else 1.0
-                 new_pos = self.pos() + delta
-                 
-                 # Update logical
-                 self.logical_rect.moveTo(new_pos.x() / z, new_pos.y() / z)
-                 self.update_visuals(z)
-                 
-                 if self.parent(): self.parent().repaint()
-
-            self.drag_start_global = curr_global
+                    # We calculate delta in logical space
+                    logical_delta = delta / z
+                    
+                    # Update logical rect position
+                    comp.logical_rect.translate(logical_delta.x(), logical_delta.y())
+                    
+                    # Update visuals from logical
+                    comp.update_visuals(z)
+                    
+                    # Auto-Expand
+                    if hasattr(parent, "expand_to_contain"):
+                        parent.expand_to_contain(comp.logical_rect)
+                    
+            # Recalculate paths for connections attached to moved components
+            if hasattr(parent, "connections"):
+                moved = {c for c in self.drag_start_positions if c.is_selected}
+                routing_cache = getattr(parent, "routing_cache", None)
+                moved_conns = [conn for conn in parent.connections
+                               if conn.start_component in moved or conn.end_component in moved]
+                invalidate = getattr(parent, "invalidate_connections", None)
+                if invalidate:
+                    invalidate(moved_conns)  # area the old routes covered
+                for conn in moved_conns:
+                    conn.update_path(parent.components, parent.connections, routing_cache=routing_cache)
+                
+                # Update jumps ONLY for the connections that just moved to eliminate drag lag.
+                # Full cross-canvas intersection sweep is deferred until mouseRelease.
+                for conn in moved_conns:
+                    conn._generate_jump_path(parent.connections)
+
+                # Repaint only where the re-routed connections were and are now;
+                # Qt already repaints the areas the moved widgets uncover
+                if invalidate:
+                    invalidate(moved_conns)
+                else:
+                    parent.update()
+        else:
+             # Single item move (fallback)
+             z = self.parent().zoom_level if (self.parent() and hasattr(self.parent(), "zoom_level")) else 1.0
+             new_pos = self.pos() + delta
+             
+             # Update logical
+             self.logical_rect.moveTo(new_pos.x() / z, new_pos.y() / z)
+             self.update_visuals(z)
+             
+             if self.parent(): self.parent().repaint()
+
+        self.drag_start_global = curr_global
 
     # MOUSE RELEASE
     def mouseReleaseEvent(self, event):
         # Forward release during connection building
-        if hasattr(self.parent(), "active_connection") and self.parent().active_connection:
+        if getattr(self.parent(), "active_connection", None):
             g = self.mapToGlobal(event.pos())
             parent_pos = self.parent().mapFromGlobal(g)
             if hasattr(self.parent(), "handle_connection_release"):
@@ -553,8 +701,13 @@ class ComponentWidget(QWidget):
                 else:
                     self.parent().handle_connection_release(parent_pos)
                 
+        # Apply a drag step still waiting for its frame before committing
+        if self._drag_timer is not None and self._drag_timer.isActive():
+            self._drag_timer.stop()
+            self._flush_drag()
+
         # UNDOABLE MOVE 
-        if hasattr(self, "drag_start_positions") and self.drag_start_positions:
+        if self.drag_start_positions:
             from src.canvas.commands import MoveCommand
             
             stack = self.parent().undo_stack
@@ -649,6 +802,13 @@ class ComponentWidget(QWidget):
         self.setFixedSize(v_w, v_h)
         self.move(v_x, v_y)
 
+    def moveEvent(self, event):
+        # Keep the canvas hit-test index in sync with our position
+        mark_dirty = getattr(self.parent(), "mark_dirty", None)
+        if mark_dirty:
+            mark_dirty(self)
+        super().moveEvent(event)
+
     # ---------------------- SERIALIZATION ----------------------
     def to_dict(self):
         return {
@@ -110,6 +110,11 @@ class Connection:
         self.calculate_path(components, other_connections, routing_cache)
         self._generate_jump_path(other_connections)
 
+        canvas = self.start_component.parent() if self.start_component is not None else None
+        mark_dirty = getattr(canvas, "mark_dirty", None)
+        if mark_dirty:
+            mark_dirty(self)
+
 
     def calculate_path(self, components=None, other_connections=None, routing_cache=None):
         """Route this connection using BFS auto-router with rule-based fallback."""
@@ -273,8 +278,9 @@ class Connection:
 
         # Candidate midpoints – try horizontal-first and vertical-first corners,
         # plus bypass rows/columns around all obstacles combined.
-        candidates = self._candidate_paths(ns, pe, blocked)
-        candidates.extend(self._expanded_fallback_candidates(ns, pe, blocked))
+        bounds = self._blocked_bounds(blocked)
+        candidates = self._candidate_paths(ns, pe, blocked, bounds)
+        candidates.extend(self._expanded_fallback_candidates(ns, pe, blocked, bounds))
 
         # Hard rule: choose only paths that do not intersect any component.
         clear_candidates = [pts for pts in candidates if self._is_path_clear(pts, blocked)]
@@ -294,7 +300,21 @@ class Connection:
         if side == "bottom": return QPointF(grip.x(), grip.y() + length)
         return QPointF(grip.x() + length, grip.y())
 
-    def _candidate_paths(self, ns: QPointF, pe: QPointF, blocked: list) -> list:
+    def _blocked_bounds(self, blocked: list):
+        """Union extent (left, right, top, bottom) of all blocked rects in one pass,
+        or None when there are no obstacles."""
+        if not blocked:
+            return None
+        first = blocked[0]
+        left, right, top, bottom = first.left(), first.right(), first.top(), first.bottom()
+        for r in blocked[1:]:
+            if r.left() < left: left = r.left()
+            if r.right() > right: right = r.right()
+            if r.top() < top: top = r.top()
+            if r.bottom() > bottom: bottom = r.bottom()
+        return left, right, top, bottom
+
+    def _candidate_paths(self, ns: QPointF, pe: QPointF, blocked: list, bounds=None) -> list:
         """Return a list of candidate point-lists, each a full orthogonal path
         from the start-grip through ns … pe to the end-grip."""
         S = QPointF(self.get_start_pos())
@@ -315,10 +335,7 @@ class Connection:
 
         # --- 5-segment bypass: route via midpoint row/column -----------------
         if blocked:
-            all_left   = min(r.left()   for r in blocked)
-            all_right  = max(r.right()  for r in blocked)
-            all_top    = min(r.top()    for r in blocked)
-            all_bottom = max(r.bottom() for r in blocked)
+            all_left, all_right, all_top, all_bottom = bounds or self._blocked_bounds(blocked)
         else:
             cx = (ns.x() + pe.x()) / 2
             cy = (ns.y() + pe.y()) / 2
@@ -370,7 +387,12 @@ class Connection:
         return score
 
     def _is_path_clear(self, points: list, blocked: list) -> bool:
-        return self._path_score(points, blocked) == 0
+        # Stop at the first hit instead of counting every intersection
+        for i in range(len(points) - 1):
+            for rect in blocked:
+                if self._seg_hits_rect(points[i], points[i + 1], rect):
+                    return False
+        return True
 
     def _path_len(self, points: list) -> float:
         total = 0.0
@@ -378,16 +400,13 @@ class Connection:
             total += abs(points[i+1].x()-points[i].x()) + abs(points[i+1].y()-points[i].y())
         return total
 
-    def _expanded_fallback_candidates(self, ns: QPointF, pe: QPointF, blocked: list) -> list:
+    def _expanded_fallback_candidates(self, ns: QPointF, pe: QPointF, blocked: list, bounds=None) -> list:
         """Create wider detours in case default candidates are blocked."""
         S = QPointF(self.get_start_pos())
         E = QPointF(self.get_end_pos())
 
         if blocked:
-            all_left = min(r.left() for r in blocked)
-            all_right = max(r.right() for r in blocked)
-            all_top = min(r.top() for r in blocked)
-            all_bottom = max(r.bottom() for r in blocked)
+            all_left, all_right, all_top, all_bottom = bounds or self._blocked_bounds(blocked)
         else:
             all_left = min(ns.x(), pe.x())
             all_right = max(ns.x(), pe.x())
@@ -539,12 +558,15 @@ class Connection:
         for i in range(len(self.path) - 1):
             p1 = self.path[i]
             p2 = self.path[i+1]
-            vec = p2 - p1
-            length = math.sqrt(vec.x()**2 + vec.y()**2)
+            x1, y1 = p1.x(), p1.y()
+            dx = p2.x() - x1
+            dy = p2.y() - y1
+            length = math.sqrt(dx * dx + dy * dy)
             if length < 0.1: continue
-            
-            # Unit direction
-            u = vec / length
+
+            # Unit direction as plain floats (no QPointF temporaries per offset)
+            ux = dx / length
+            uy = dy / length
 
             # Identify intersections
             intersections = []
@@ -605,14 +627,14 @@ class Connection:
                 # Draw line to jump start
                 segment_end_dist = dist - r
                 if segment_end_dist > current_dist:
-                    dest = p1 + u * segment_end_dist
-                    self.painter_path.lineTo(dest)
-                
-                jump_center = p1 + u * dist
-                rect = QRectF(jump_center.x() - r, jump_center.y() - r, 2*r, 2*r)
-                
+                    self.painter_path.lineTo(x1 + ux * segment_end_dist, y1 + uy * segment_end_dist)
+
+                cx = x1 + ux * dist
+                cy = y1 + uy * dist
+                rect = QRectF(cx - r, cy - r, 2*r, 2*r)
+
                 # Angle in degrees for arcTo (0 is 3 o'clock, + CCW)
-                angle = math.degrees(math.atan2(u.y(), u.x()))
+                angle = math.degrees(math.atan2(uy, ux))
                 # For Y-down coord system:
                 # (1,0) -> 0, (-1,0) -> 180, (0,1) -> 90, (0,-1) -> -90
                 # arcTo(rect, startAddr, sweep)
@@ -625,71 +647,84 @@ class Connection:
                 self.painter_path.lineTo(p2)
 
 
-    def paint(self, painter, theme="light", zoom=1.0, layer="all"):
-        # Determine visual width based on selection
-        visual_width = 4.0 if self.is_selected else 2.5
-        
-        # Calculate LOGICAL width to maintain constant VISUAL width
-        pen_width = visual_width / max(0.1, zoom)
-
+    @staticmethod
+    def line_pen(theme="light"):
         pen_color = Qt.white if theme == "dark" else Qt.black
-        brush_color = pen_color # Inherit arrow color
+        return QPen(pen_color, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+
+    @staticmethod
+    def arrow_style(theme="light", zoom=1.0):
+        """(pen, brush) for arrowheads: theme-coloured fill with a high-contrast black border."""
+        # Solid Black border ensures visibility on top of EVERYTHING.
+        border_width = 1.5 / max(0.1, zoom)
+        brush_color = Qt.white if theme == "dark" else Qt.black # Inherit line color
+        return QPen(Qt.black, border_width), QBrush(brush_color)
+
+    def paint_line(self, painter):
+        """Stroke the path (line & jumps) with the painter's current pen."""
+        # Fallback to simple path if painter_path empty
+        if self.painter_path.isEmpty() and self.path:
+             painter.drawPolyline(QPolygonF(self.path))
+        else:
+             painter.drawPath(self.painter_path)
+
+    def arrow_polygon(self, zoom=1.0):
+        """Arrowhead at the end of the path, or None if there is no last segment."""
+        if len(self.path) < 2:
+            return None
+
+        p_end = self.path[-1]
+        p_prev = self.path[-2]
+        
+        # Vector
+        vec = p_end - p_prev
+        l = math.sqrt(vec.x()**2 + vec.y()**2)
+        if l <= 0:
+            return None
+
+        # Normalize
+        u = vec / l
         
-        pen = QPen(pen_color, 2, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+        # Arrow tip connects directly to the grip point (no retraction)
+        # This ensures the connection line touches the grip exactly
+        p_tip = p_end
+        
+        # Arrow Geometry
+        # Maintain constant VISUAL size for the arrow
+        visual_arrow_size = 15.0
+        arrow_size = visual_arrow_size / max(0.1, zoom)
+        
+        # Perpendicular vector (-y, x)
+        perp = QPointF(-u.y(), u.x())
+        
+        p_base = p_tip - u * arrow_size
+        
+        p1 = p_base + perp * (arrow_size / 2.5)
+        p2 = p_base - perp * (arrow_size / 2.5)
+        
+        return QPolygonF([p_tip, p1, p2])
+
+    def paint(self, painter, theme="light", zoom=1.0, layer="all"):
+        """Paint this connection alone. painter.draw_connections batches pen/brush state instead."""
+        pen = self.line_pen(theme)
         painter.setPen(pen)
         painter.setBrush(Qt.NoBrush)
         
         # 1. Draw Path (Line & Jumps)
         if layer in ("all", "lines"):
-            # Fallback to simple path if painter_path empty
-            if self.painter_path.isEmpty() and self.path:
-                 for i in range(len(self.path)-1):
-                     painter.drawLine(self.path[i], self.path[i+1])
-            else:
-                 painter.drawPath(self.painter_path)
+            self.paint_line(painter)
 
         # 2. Draw Arrow at End
-        if layer in ("all", "arrows") and len(self.path) >= 2:
-            p_end = self.path[-1]
-            p_prev = self.path[-2]
-            
-            # Vector
-            vec = p_end - p_prev
-            l = math.sqrt(vec.x()**2 + vec.y()**2)
-            if l > 0:
-                # Normalize
-                u = vec / l
-                
-                # Arrow tip connects directly to the grip point (no retraction)
-                # This ensures the connection line touches the grip exactly
-                p_tip = p_end
-                
-                # Arrow Geometry
-                # Maintain constant VISUAL size for the arrow
-                visual_arrow_size = 15.0
-                arrow_size = visual_arrow_size / max(0.1, zoom)
-                
-                # Perpendicular vector (-y, x)
-                perp = QPointF(-u.y(), u.x())
-                
-                p_base = p_tip - u * arrow_size
-                
-                p1 = p_base + perp * (arrow_size / 2.5)
-                p2 = p_base - perp * (arrow_size / 2.5)
-                
-                arrow_poly = QPolygonF([p_tip, p1, p2])
-                
-                # Draw Arrow with High Contrast Black Border
-                # Solid Black border ensures visibility on top of EVERYTHING.
-                border_width = 1.5 / max(0.1, zoom)
-                painter.setPen(QPen(Qt.black, border_width))
-                painter.setBrush(QBrush(brush_color))
+        if layer in ("all", "arrows"):
+            arrow_poly = self.arrow_polygon(zoom)
+            if arrow_poly is not None:
+                arrow_pen, arrow_brush = self.arrow_style(theme, zoom)
+                painter.setPen(arrow_pen)
+                painter.setBrush(arrow_brush)
                 painter.drawPolygon(arrow_poly)
                 painter.setBrush(Qt.NoBrush) # Reset
                 painter.setPen(pen) # Restore pen
 
-
-
     def to_dict(self, component_to_id):
         """
         Serializes connection.
@@ -10,6 +10,13 @@ from src.theme_manager import theme_manager
 from src.navigation import slide_to_index
 from src.toast import show_toast
 from src.api_client import login as api_login, register as api_register, ApiError
+from src.workers import run_in_pool
+
+
+def _api_error_message(exc):
+    if isinstance(exc, ApiError):
+        return str(exc)
+    return f"Unexpected error: {exc}"
 
 
 class WelcomeScreen(QDialog):
@@ -20,8 +27,9 @@ class WelcomeScreen(QDialog):
         self.login.clicked.connect(self.gotologin)
         self.create.clicked.connect(self.gotocreate)
 
-        if hasattr(self, "themeToggle"):
-            self.themeToggle.clicked.connect(self.toggle_theme)
+        self._theme_toggle = getattr(self, "themeToggle", None)
+        if self._theme_toggle is not None:
+            self._theme_toggle.clicked.connect(self.toggle_theme)
         
         # Connect to theme manager
         theme_manager.theme_changed.connect(self.on_theme_changed)
@@ -51,7 +59,8 @@ class WelcomeScreen(QDialog):
         self.center_content()
 
     def update_theme_button(self, theme):
-        if not hasattr(self, "themeToggle"):
+        btn = self._theme_toggle
+        if btn is None:
             return
             
         if theme == "light":
@@ -60,11 +69,11 @@ class WelcomeScreen(QDialog):
             icon_path = os.path.join("ui", "res", "sun.png")
             
         if os.path.exists(icon_path):
-            self.themeToggle.setIcon(QtGui.QIcon(icon_path))
-            self.themeToggle.setIconSize(QtCore.QSize(32, 32))
-            self.themeToggle.setText("")
+            btn.setIcon(QtGui.QIcon(icon_path))
+            btn.setIconSize(QtCore.QSize(32, 32))
+            btn.setText("")
         else:
-            self.themeToggle.setText("Dark mode" if theme == "light" else "Light mode")
+            btn.setText("Dark mode" if theme == "light" else "Light mode")
 
     def changeEvent(self, event):
         """Detect system theme changes."""
@@ -76,9 +85,7 @@ class WelcomeScreen(QDialog):
         self.center_content()
         self.position_theme_toggle()
 
-        bg = self.findChild(QtWidgets.QWidget, "bgwidget")
-        if bg:
-            bg.setGeometry(self.rect())
+        self.bgwidget.setGeometry(self.rect())
         super().resizeEvent(event)
 
     def center_content(self):
@@ -114,8 +121,9 @@ class LoginScreen(QDialog):
         if hasattr(self, "backToWelcome"):
             self.backToWelcome.clicked.connect(self.gotowelcome)
 
-        if hasattr(self, "themeToggle"):
-            self.themeToggle.clicked.connect(self.toggle_theme)
+        self._theme_toggle = getattr(self, "themeToggle", None)
+        if self._theme_toggle is not None:
+            self._theme_toggle.clicked.connect(self.toggle_theme)
         
         # Connect to theme manager
         theme_manager.theme_changed.connect(self.on_theme_changed)
@@ -138,7 +146,8 @@ class LoginScreen(QDialog):
         self.center_content()
 
     def update_theme_button(self, theme):
-        if not hasattr(self, "themeToggle"):
+        btn = self._theme_toggle
+        if btn is None:
             return
             
         if theme == "light":
@@ -147,11 +156,11 @@ class LoginScreen(QDialog):
             icon_path = os.path.join("ui", "res", "sun.png")
 
         if os.path.exists(icon_path):
-            self.themeToggle.setIcon(QtGui.QIcon(icon_path))
-            self.themeToggle.setIconSize(QtCore.QSize(32, 32))
-            self.themeToggle.setText("")
+            btn.setIcon(QtGui.QIcon(icon_path))
+            btn.setIconSize(QtCore.QSize(32, 32))
+            btn.setText("")
         else:
-            self.themeToggle.setText("Dark mode" if theme == "light" else "Light mode")
+            btn.setText("Dark mode" if theme == "light" else "Light mode")
 
     def changeEvent(self, event):
         """Detect system theme changes."""
@@ -163,9 +172,7 @@ class LoginScreen(QDialog):
         self.center_content()
         self.position_theme_toggle()
 
-        bg = self.findChild(QtWidgets.QWidget, "bgwidget")
-        if bg:
-            bg.setGeometry(self.rect())
+        self.bgwidget.setGeometry(self.rect())
         super().resizeEvent(event)
 
     def center_content(self):
@@ -208,12 +215,18 @@ class LoginScreen(QDialog):
 
         self.error.setText("")
 
-        try:
-            access, refresh = api_login(user, password)
-        except ApiError as e:
-            self.error.setText(str(e))
-            return
+        # Network call runs off the GUI thread; block resubmits until it answers
+        self.login.setEnabled(False)
+        run_in_pool(lambda: api_login(user, password),
+                    lambda tokens: self._on_login_success(user, *tokens),
+                    self._on_api_error)
 
+    def _on_api_error(self, exc):
+        self.login.setEnabled(True)
+        self.error.setText(_api_error_message(exc))
+
+    def _on_login_success(self, user, access, refresh):
+        self.login.setEnabled(True)
         app_state.access_token = access
         app_state.refresh_token = refresh
         app_state.current_user = user
@@ -239,8 +252,9 @@ class CreateAccScreen(QDialog):
         self.error.setWordWrap(True)
         self.backToLogin.clicked.connect(self.gotologin)
 
-        if hasattr(self, "themeToggle"):
-            self.themeToggle.clicked.connect(self.toggle_theme)
+        self._theme_toggle = getattr(self, "themeToggle", None)
+        if self._theme_toggle is not None:
+            self._theme_toggle.clicked.connect(self.toggle_theme)
         
         # Connect to theme manager
         theme_manager.theme_changed.connect(self.on_theme_changed)
@@ -265,7 +279,8 @@ class CreateAccScreen(QDialog):
         self.center_content()
 
     def update_theme_button(self, theme):
-        if not hasattr(self, "themeToggle"):
+        btn = self._theme_toggle
+        if btn is None:
             return
             
         if theme == "light":
@@ -274,11 +289,11 @@ class CreateAccScreen(QDialog):
             icon_path = os.path.join("ui", "res", "sun.png")
 
         if os.path.exists(icon_path):
-            self.themeToggle.setIcon(QtGui.QIcon(icon_path))
-            self.themeToggle.setIconSize(QtCore.QSize(32, 32))
-            self.themeToggle.setText("")
+            btn.setIcon(QtGui.QIcon(icon_path))
+            btn.setIconSize(QtCore.QSize(32, 32))
+            btn.setText("")
         else:
-            self.themeToggle.setText("Dark mode" if theme == "light" else "Light mode")
+            btn.setText("Dark mode" if theme == "light" else "Light mode")
 
     def changeEvent(self, event):
         """Detect system theme changes."""
@@ -290,9 +305,7 @@ class CreateAccScreen(QDialog):
         self.center_content()
         self.position_theme_toggle()
 
-        bg = self.findChild(QtWidgets.QWidget, "bgwidget")
-        if bg:
-            bg.setGeometry(self.rect())
+        self.bgwidget.setGeometry(self.rect())
         super().resizeEvent(event)
 
     def center_content(self):
@@ -364,12 +377,18 @@ class CreateAccScreen(QDialog):
         username = email
         self.error.setText("")
 
-        try:
-            api_register(username, email, password)
-        except ApiError as e:
-            self.error.setText(str(e))
-            return
+        # Network call runs off the GUI thread; block resubmits until it answers
+        self.signup.setEnabled(False)
+        run_in_pool(lambda: api_register(username, email, password),
+                    self._on_signup_success,
+                    self._on_api_error)
+
+    def _on_api_error(self, exc):
+        self.signup.setEnabled(True)
+        self.error.setText(_api_error_message(exc))
 
+    def _on_signup_success(self, _result):
+        self.signup.setEnabled(True)
         show_toast("Account created successfully!")
         self.emailfield.clear()
         self.passwordfield.clear()
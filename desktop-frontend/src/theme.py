@@ -3,6 +3,20 @@ import src.app_state as app_state
 
 from src.fader import ThemeFader
 
+def _bgwidget(screen):
+    """The screen's "bgwidget", looked up once and remembered on the screen."""
+    # loadUi (and LandingPage) already expose it as an attribute
+    bg = getattr(screen, "bgwidget", None)
+    if isinstance(bg, QtWidgets.QWidget):
+        return bg
+    try:
+        return screen._theme_bgwidget
+    except AttributeError:
+        # Screens without one (e.g. the canvas) cache the miss too, so the
+        # full-tree findChild walk happens once rather than on every toggle
+        bg = screen._theme_bgwidget = screen.findChild(QtWidgets.QWidget, "bgwidget")
+        return bg
+
 def apply_theme_to_screen(screen, theme=None):
     """Apply theme to one screen by setting bgwidget[theme] property.
     Used by screens when they receive theme_changed signal from theme manager.
@@ -12,15 +26,18 @@ def apply_theme_to_screen(screen, theme=None):
     else:
         app_state.current_theme = theme
 
-    bg = screen.findChild(QtWidgets.QWidget, "bgwidget")
+    bg = _bgwidget(screen)
     if bg is not None:
         bg.setProperty("theme", theme)
-        bg.style().unpolish(bg)
-        bg.style().polish(bg)
-        
-        # Force update on all children to ensure inherited styles (like [theme="dark"] descendant selectors) apply
-        for child in bg.findChildren(QtWidgets.QWidget):
-            child.style().unpolish(child)
-            child.style().polish(child)
-        
+        sheet = bg.styleSheet()
+        if sheet:
+            # Re-setting its own sheet makes Qt repolish bg and every descendant
+            # in one C++ pass, so [theme="dark"] descendant selectors re-resolve
+            bg.setStyleSheet(sheet)
+        else:
+            # Styled only by the app-wide sheet (e.g. LandingPage): force update
+            # on all children so inherited [theme] selectors apply
+            for w in [bg] + bg.findChildren(QtWidgets.QWidget):
+                w.style().unpolish(w)
+                w.style().polish(w)
         bg.update()
@@ -58,7 +58,17 @@ class ThemeManager(QObject):
         app_state.current_theme = theme
         
         print(f"[THEME MANAGER] Theme changed to: {theme}")
-        self.theme_changed.emit(theme)
+        # Every screen restyles in its slot; hold painting on the stack until all
+        # are done so the toggle produces one repaint instead of one per screen
+        stack = app_state.widget
+        if stack is None:
+            self.theme_changed.emit(theme)
+            return
+        stack.setUpdatesEnabled(False)
+        try:
+            self.theme_changed.emit(theme)
+        finally:
+            stack.setUpdatesEnabled(True)  # schedules the single repaint
     
     def on_system_theme_changed(self):
         """Called when system theme changes (detected via changeEvent)."""
@@ -0,0 +1,49 @@
+"""
+Background jobs on the global QThreadPool, reported back on the GUI thread.
+"""
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class _TaskSignals(QObject):
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(object)  # the exception raised by the job
+
+
+class _Task(QRunnable):
+    """
+    Runs one blocking callable on QThreadPool; its result or exception is
+    delivered back on the GUI thread (the signals object lives there).
+    """
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.succeeded.emit(result)
+
+
+_pending_tasks = set()  # Keeps signal objects alive until their task reports back
+
+
+def run_in_pool(fn, on_success, on_error):
+    """
+    Queue `fn()` on the global thread pool. on_success(result) or
+    on_error(exception) is called on the GUI thread once it finishes.
+    """
+    task = _Task(fn)
+    signals = task.signals
+    _pending_tasks.add(signals)
+
+    def _finish(handler, value):
+        _pending_tasks.discard(signals)
+        handler(value)
+
+    signals.succeeded.connect(lambda result: _finish(on_success, result))
+    signals.failed.connect(lambda exc: _finish(on_error, exc))
+    QThreadPool.globalInstance().start(task)
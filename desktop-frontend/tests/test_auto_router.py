@@ -0,0 +1,42 @@
+import os
+import sys
+
+from PyQt5.QtCore import QPointF, QRectF
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src import auto_router
+
+
+def _route_around_tank(canvas_side, routing_cache=None):
+    tank = QRectF(1000, 1000, 100, 300)
+    return auto_router.find_path(
+        QPointF(900, 1100), QPointF(1250, 1150), "right", "left",
+        [tank], [], [], QRectF(0, 0, canvas_side, canvas_side), routing_cache,
+    )
+
+
+def test_route_does_not_depend_on_canvas_size():
+    path = _route_around_tank(2000)
+    assert len(path) > 2
+    assert _route_around_tank(12000) == path
+
+    cache = auto_router.build_routing_cache([QRectF(5000, 5000, 80, 80)], [])
+    assert _route_around_tank(12000, cache) == path
+
+
+def test_astar_tables_are_sized_to_the_search_region(monkeypatch):
+    sizes = []
+    search = auto_router._astar_search
+
+    def recording_search(cspace, grid_h, roi, sg, eg):
+        sizes.append((len(cspace), roi))
+        return search(cspace, grid_h, roi, sg, eg)
+
+    monkeypatch.setattr(auto_router, "_astar_search", recording_search)
+    _route_around_tank(12000)
+
+    (size, (col_lo, col_hi, row_lo, row_hi)), = sizes
+    assert size == (col_hi - col_lo + 1) * (row_hi - row_lo + 1)
+    assert size < 200 * 200
@@ -0,0 +1,176 @@
+import os
+import sys
+
+from PyQt5.QtCore import QPointF, QRect, QRectF
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.canvas.export import get_content_rect
+
+
+class MockComponent:
+    def __init__(self, x, y, w, h):
+        self._geometry = QRect(x, y, w, h)
+
+    def geometry(self):
+        return self._geometry
+
+
+class MockConnection:
+    def __init__(self, points):
+        self.path = [QPointF(x, y) for x, y in points]
+
+
+class MockCanvas:
+    def __init__(self):
+        self.components = []
+        self.connections = []
+
+    def rect(self):
+        return QRect(0, 0, 800, 600)
+
+
+def test_content_rect_of_empty_canvas_is_canvas_rect():
+    assert get_content_rect(MockCanvas()) == QRectF(0, 0, 800, 600)
+
+
+def test_content_rect_matches_united_bounds():
+    canvas = MockCanvas()
+    canvas.components = [MockComponent(100, 50, 40, 30), MockComponent(300, 200, 60, 60)]
+    canvas.connections = [MockConnection([(90, 400), (500, 400)]), MockConnection([])]
+
+    expected = QRectF()
+    for comp in canvas.components:
+        expected = expected.united(QRectF(comp.geometry()))
+    for conn in canvas.connections:
+        for p in conn.path:
+            expected = expected.united(QRectF(p.x(), p.y(), 1, 1))
+    expected.adjust(-50, -50, 50, 50)
+
+    assert get_content_rect(canvas) == expected
+
+
+def test_image_pool_reuses_released_buffer():
+    from PyQt5.QtCore import QSize
+    from src.canvas import export
+
+    export._image_pool.clear()
+    first = export._acquire_image(QSize(64, 32))
+    export._release_image(first)
+    assert export._acquire_image(QSize(64, 32)) is first
+    assert export._acquire_image(QSize(64, 32)) is not first
+    assert not export._image_pool
+
+
+class MockPfdComponent:
+    def __init__(self, x):
+        self.x = x
+
+    def to_dict(self):
+        return {"x": self.x, "y": 20.0, "width": 80.0, "height": 60.0, "rotation": 0,
+                "svg_path": "pump.svg", "config": {"name": "Pump", "s_no": "101"}}
+
+    def get_grips(self):
+        return [{"x": 0, "y": 50, "side": "left"}]
+
+
+class MockPfdConnection:
+    def __init__(self, start, end):
+        self.start_component = start
+        self.end_component = end
+        self.start_grip_index = 0
+        self.end_grip_index = 1
+        self.start_side = "right"
+        self.end_side = "left"
+        self.path_offset = 0.0
+        self.start_adjust = 0.0
+        self.end_adjust = 0.0
+
+
+def test_streamed_pfd_matches_pretty_output(tmp_path):
+    import json
+    from src.canvas.export import save_to_pfd
+
+    canvas = MockCanvas()
+    canvas.zoom_level = 1.0
+    canvas.components = [MockPfdComponent(10.0), MockPfdComponent(200.0)]
+    canvas.connections = [MockPfdConnection(*canvas.components)]
+
+    save_to_pfd(canvas, str(tmp_path / "compact.pfd"))
+    save_to_pfd(canvas, str(tmp_path / "pretty.pfd"), pretty=True)
+    compact = json.loads((tmp_path / "compact.pfd").read_text())
+    pretty = json.loads((tmp_path / "pretty.pfd").read_text())
+
+    assert compact["canvasState"] == pretty["canvasState"]
+    assert compact["canvasState"]["connections"][0]["targetItemId"] == 1
+    assert compact["viewport"] == pretty["viewport"]
+
+
+def test_background_export_reports_back_and_releases_image():
+    from PyQt5.QtCore import QSize, QThreadPool
+    from PyQt5.QtWidgets import QApplication
+    from src import workers
+    from src.canvas import export
+
+    app = QApplication.instance() or QApplication([])
+    export._image_pool.clear()
+    image = export._acquire_image(QSize(16, 16))
+    results = []
+
+    export._start_export(lambda: True, image, results.append)
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+    assert results == [True]
+    assert not workers._pending_tasks
+    assert export._acquire_image(QSize(16, 16)) is image
+
+
+def test_background_export_reports_failure_when_job_raises():
+    from PyQt5.QtCore import QSize, QThreadPool
+    from PyQt5.QtWidgets import QApplication
+    from src import workers
+    from src.canvas import export
+
+    app = QApplication.instance() or QApplication([])
+    export._image_pool.clear()
+    image = export._acquire_image(QSize(16, 16))
+    results = []
+
+    export._start_export(lambda: 1 / 0, image, results.append)
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+    assert results == [False]
+    assert not workers._pending_tasks
+    assert export._acquire_image(QSize(16, 16)) is image
+
+
+def test_display_name_falls_back_to_svg_filename():
+    from src.canvas.export import _display_name
+
+    assert _display_name("Pump", "905_Centrifugal_Pump.svg") == "Pump"
+    assert _display_name("", "/lib/905_Centrifugal_Pump.svg") == "Centrifugal Pump"
+    assert _display_name("Unknown Component", None) == "Unknown Component"
+
+
+def test_pfd_round_trip_without_orjson(tmp_path, monkeypatch):
+    from src.canvas import export
+
+    monkeypatch.setattr(export, "orjson", None)
+    test_streamed_pfd_matches_pretty_output(tmp_path)
+    assert export._json_loads(export._json_encode({"a": [1, "é"]})) == {"a": [1, "é"]}
+
+
+def test_load_rejects_unknown_pfd_without_clearing_canvas(tmp_path):
+    from src.canvas.export import load_from_pfd
+
+    canvas = MockCanvas()
+    canvas.setUpdatesEnabled = lambda enabled: None
+    canvas.components = ["existing"]
+    for bad in ('{"canvasState": {"items": [1, 2]}}', '{"unknown": []}', '[]'):
+        path = tmp_path / "bad.pfd"
+        path.write_text(bad)
+        assert load_from_pfd(canvas, str(path)) is False
+    assert canvas.components == ["existing"]
@@ -0,0 +1,36 @@
+import os
+import random
+import sys
+
+from PyQt5.QtCore import QRectF
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.canvas.spatial import QuadTree
+
+
+def test_quadtree_query_matches_linear_scan():
+    rng = random.Random(7)
+    rects = [QRectF(rng.uniform(0, 2000), rng.uniform(0, 1500), rng.uniform(1, 300), rng.uniform(1, 300))
+             for _ in range(400)]
+    bounds = QRectF()
+    for rect in rects:
+        bounds = bounds.united(rect)
+
+    tree = QuadTree(bounds, max_items=10, max_depth=8)
+    for i, rect in enumerate(rects):
+        tree.insert(rect, i)
+    assert tree.children is not None
+
+    for _ in range(200):
+        probe = QRectF(rng.uniform(-100, 2300), rng.uniform(-100, 1800), 1, 1)
+        expected = [i for i, rect in enumerate(rects) if rect.intersects(probe)]
+        assert sorted(tree.query(probe)) == expected
+
+
+def test_quadtree_query_outside_bounds_is_empty():
+    tree = QuadTree(QRectF(0, 0, 100, 100))
+    tree.insert(QRectF(10, 10, 20, 20), "a")
+    assert tree.query(QRectF(500, 500, 1, 1)) == []
+    assert tree.query(QRectF(15, 15, 1, 1)) == ["a"]